@@ -0,0 +1,132 @@
+"""audioManager
+    * Holds the AudioManager class and the audioManager used by the whole game
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import logging
+import pygame
+from loadsources import load_sound, load_collect_sound
+from gameConstants import *
+
+
+class AudioManager:
+    """AudioManager class
+    * Loads all sound effects once and hands them out from a cache
+    * Plays sound effects on a fixed pool of reserved mixer channels
+    * Remembers the loaded music track, so it is only loaded once
+
+    Public Methods:
+    * def preload(self)
+    * def get_sound(self, name)
+    * def play_effect(self, name)
+    * def load_music(self, filename)
+    """
+
+    def __init__(self):
+        self.sounds = {}
+        self.channels = []
+        self.nextChannelIdx = 0
+        self.musicFile = None
+        self.preloaded = False
+
+    def preload(self):
+        """preload
+        * Reserves the sound effect channels and loads all SOUND_EFFECTS
+        * Does nothing if already done, disables sound effects if the mixer is not initialized
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * All SOUND_EFFECTS are in the cache after preload
+            * Calling preload twice loads no file again
+        """
+        if self.preloaded:
+            return
+        self.preloaded = True
+        if not pygame.mixer.get_init():
+            logging.warning("Mixer is not initialized, sound effects are disabled")
+            return
+
+        logging.info("Preloading sound effects...")
+        # Reserve channels, so music or other sounds can't take them
+        if pygame.mixer.get_num_channels() < AUDIO_RESERVED_CHANNELS:
+            pygame.mixer.set_num_channels(AUDIO_RESERVED_CHANNELS)
+        pygame.mixer.set_reserved(AUDIO_RESERVED_CHANNELS)
+        self.channels = [
+            pygame.mixer.Channel(i) for i in range(0, AUDIO_RESERVED_CHANNELS)
+        ]
+        for name, filename in SOUND_EFFECTS.items():
+            self.sounds[name] = load_collect_sound(filename)
+        logging.info("Preloading sound effects was successful")
+
+    def get_sound(self, name):
+        """get sound
+        * Returns a cached sound effect
+
+        Args:
+            name (string): Name of the sound effect in SOUND_EFFECTS
+
+        Return:
+            sound (pygame.mixer.Sound): Cached sound, None if sound effects are disabled
+
+        Test:
+            * Same Sound object is returned on every call
+            * Unknown name returns None
+        """
+        self.preload()
+        return self.sounds.get(name)
+
+    def play_effect(self, name):
+        """play effect
+        * Plays a cached sound effect on the next reserved channel
+        * If all channels are busy, the sound on the next channel is replaced
+
+        Args:
+            name (string): Name of the sound effect in SOUND_EFFECTS
+
+        Return:
+            None
+
+        Test:
+            * Sound effect is audible
+            * Playing more effects than channels at once does not result in exception
+        """
+        sound = self.get_sound(name)
+        if sound is None or len(self.channels) == 0:
+            return
+        channel = self.channels[self.nextChannelIdx]
+        self.nextChannelIdx = (self.nextChannelIdx + 1) % len(self.channels)
+        channel.play(sound)
+
+    def load_music(self, filename):
+        """load music
+        * Loads a music track for pygame.mixer.music if it is not the loaded one already
+
+        Args:
+            filename (string): Filename of the music track
+
+        Raises:
+            SystemExit: Music can't be loaded
+
+        Return:
+            None
+
+        Test:
+            * Loading the same track twice reads the file once
+            * Loaded track can be played with pygame.mixer.music.play
+        """
+        if self.musicFile == filename:
+            return
+        load_sound(filename)
+        self.musicFile = filename
+
+
+# Audio manager of the whole game
+audioManager = AudioManager()
@@ -0,0 +1,243 @@
+"""bench_levels
+    * Measures loading and frame times of every level in assets/levels with scripted input
+    * Frame times are split into update, collision and draw, reported as percentiles (p50/p95/p99)
+    * Blits onto the game Surface per frame are reported as percentiles as well
+    * Writes the results as json and flags regressions against a stored baseline
+    * Run from the repository root: python benchmarks/bench_levels.py [--ticks N] [--script FILE]
+      [--output FILE] [--baseline FILE] [--save-baseline] [--tolerance FRACTION]
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import os
+import sys
+import argparse
+import json
+import random
+import time
+import logging
+
+# Run without window and sound, from the repository root
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+
+import pygame
+from gameLoader import GameLoader
+from game import Game
+from frameProfiler import FrameProfiler, percentile
+from inputScript import load_input_script, random_input_script
+from loadsources import check_level_exists
+from gameConstants import *
+
+LOAD_REPEATS = 5
+PERCENTS = [50, 95, 99]
+SECTIONS = ["update", "collision", "draw"]
+# Percentiles compared with the baseline, p99 is reported only (few frames, too noisy)
+COMPARED_PERCENTS = ["p50", "p95"]
+# Differences below this many milliseconds are never flagged, they are noise
+MIN_REGRESSION_MS = 0.05
+
+
+def time_loading(levelNum):
+    """time loading
+    * Times GameLoader.load_level and load_npc_paths of a level, each on its own new GameLoader per repeat
+    * So both include getting the compiled level (cache file or .png parsing), none reuses the other's work
+    * Image files are cached by the asset registry after the first repeat
+
+    Args:
+        levelNum (int): Number of the level
+
+    Return:
+        (dict): Median milliseconds of load_level and load_npc_paths
+    """
+    levelTimes = []
+    pathTimes = []
+    for repeat in range(0, LOAD_REPEATS):
+        gameLoader = GameLoader()
+        start = time.perf_counter()
+        gameLoader.load_level(levelNum)
+        levelTimes.append(time.perf_counter() - start)
+        gameLoader = GameLoader()
+        start = time.perf_counter()
+        gameLoader.load_npc_paths(levelNum)
+        pathTimes.append(time.perf_counter() - start)
+    return {
+        "load_level_ms": round(percentile(levelTimes, 50) * 1e3, 3),
+        "load_npc_paths_ms": round(percentile(pathTimes, 50) * 1e3, 3),
+    }
+
+
+def time_frames(gameLoader, levelNum, ticks, inputScript):
+    """time frames
+    * Plays a level for a number of ticks, restarts it on death and on win
+
+    Args:
+        gameLoader (GameLoader): Loader of the level
+        levelNum (int): Number of the level
+        ticks (int): Number of ticks to play
+        inputScript (InputScript): Pressed keys by tick
+
+    Return:
+        (dict): Percentiles of frame, update, collision and draw milliseconds and of blits
+    """
+    random.seed(levelNum)
+    pressedKeys = []
+    game = Game(
+        gameLoader,
+        {"currentLvl": levelNum, "maskCount": 0, "deathCount": 0},
+        pressedKeys,
+    )
+    profiler = FrameProfiler(SECTIONS, ticks)
+    game.enable_profiling(profiler)
+
+    frameTimes = []
+    blitCounts = []
+    for tick in range(0, ticks):
+        inputScript.apply(tick, pressedKeys)
+        start = time.perf_counter()
+        game.update_game()
+        restart = game.checkDeath() or game.checkWin()
+        frameTimes.append(time.perf_counter() - start)
+        blitCounts.append(game.blitCount)
+        profiler.end_frame()
+        if restart:
+            # Stay on this level, restarting is not timed
+            game.reset({"currentLvl": levelNum, "maskCount": 0, "deathCount": 0})
+
+    result = {}
+    for name, times in [("frame", frameTimes)] + [
+        (section, profiler.get_history(section)) for section in SECTIONS
+    ]:
+        result[name + "_ms"] = {
+            "p" + str(percent): round(percentile(times, percent) * 1e3, 3)
+            for percent in PERCENTS
+        }
+    result["blits"] = {
+        "p" + str(percent): percentile(blitCounts, percent) for percent in PERCENTS
+    }
+    return result
+
+
+def find_regressions(results, baseline, tolerance):
+    """find regressions
+    * Compares load times, frame time and blit percentiles of all levels with the baseline
+
+    Args:
+        results (dict): Results of this run
+        baseline (dict): Results of the baseline run
+        tolerance (float): Allowed slowdown as fraction of the baseline value
+
+    Return:
+        regressions (list): Descriptions of all values higher than allowed
+    """
+    regressions = []
+    for levelNum, levelResult in results["levels"].items():
+        baseLevel = baseline["levels"].get(levelNum)
+        if baseLevel is None:
+            continue
+        for name, value in levelResult.items():
+            if name not in baseLevel:
+                continue
+            if isinstance(value, dict):
+                pairs = [
+                    (name + " " + p, value[p], baseLevel[name].get(p))
+                    for p in COMPARED_PERCENTS
+                ]
+            else:
+                pairs = [(name, value, baseLevel[name])]
+            unit = " ms" if name.endswith("_ms") else ""
+            for label, new, old in pairs:
+                if old is None:
+                    continue
+                if new > old * (1 + tolerance) and new - old > MIN_REGRESSION_MS:
+                    regressions.append(
+                        "level %s %s: %.3f%s (baseline %.3f%s)"
+                        % (levelNum, label, new, unit, old, unit)
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark all levels")
+    parser.add_argument("--ticks", type=int, default=1000, help="ticks per level")
+    parser.add_argument("--script", help="input script (json), random keys if unset")
+    parser.add_argument("--output", help="json file for the results")
+    parser.add_argument(
+        "--baseline",
+        default=os.path.join("benchmarks", "baseline.json"),
+        help="json results to compare with",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store results as baseline"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown (fraction)"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    gameLoader = GameLoader()
+
+    results = {"ticks": args.ticks, "levels": {}}
+    levelNum = 1
+    while check_level_exists(levelNum):
+        if args.script:
+            inputScript = load_input_script(args.script)
+        else:
+            inputScript = random_input_script(levelNum, args.ticks)
+        levelResult = time_loading(levelNum)
+        levelResult.update(time_frames(gameLoader, levelNum, args.ticks, inputScript))
+        results["levels"][str(levelNum)] = levelResult
+        print(
+            "level %2d  load %7.2f ms  paths %6.2f ms  frame p50 %6.3f p95 %6.3f p99 %6.3f ms"
+            % (
+                levelNum,
+                levelResult["load_level_ms"],
+                levelResult["load_npc_paths_ms"],
+                levelResult["frame_ms"]["p50"],
+                levelResult["frame_ms"]["p95"],
+                levelResult["frame_ms"]["p99"],
+            )
+        )
+        print(
+            "          "
+            + "  ".join(
+                "%s p50 %6.3f p95 %6.3f ms"
+                % (
+                    section,
+                    levelResult[section + "_ms"]["p50"],
+                    levelResult[section + "_ms"]["p95"],
+                )
+                for section in SECTIONS
+            )
+            + "  blits p50 %d p95 %d"
+            % (levelResult["blits"]["p50"], levelResult["blits"]["p95"])
+        )
+        levelNum = levelNum + 1
+
+    if args.output:
+        with open(args.output, "w") as outputFile:
+            outputFile.write(json.dumps(results, indent=2))
+    if args.save_baseline:
+        with open(args.baseline, "w") as baselineFile:
+            baselineFile.write(json.dumps(results, indent=2))
+        print("Baseline saved to " + args.baseline)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r") as baselineFile:
+            baseline = json.loads(baselineFile.read())
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print("REGRESSION " + regression)
+        if regressions:
+            raise SystemExit(1)
+        print("No regressions against " + args.baseline)
+
+
+if __name__ == "__main__":
+    main()
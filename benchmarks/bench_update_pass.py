@@ -0,0 +1,121 @@
+"""bench_update_pass
+    * Compares the per frame cost of the sprite update pass of Game.update_game on one level
+    * Before: update() is called on all sprites, after: only on animated scenery and actors
+    * Run from the repository root: python benchmarks/bench_update_pass.py [--frames N] [--level N]
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import os
+import sys
+import argparse
+import random
+import time
+import logging
+
+# Run without window and sound, from the repository root
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+
+import pygame
+from gameLoader import GameLoader
+from game import Game
+from gameConstants import *
+
+ROUNDS = 5
+
+
+def run_game(gameLoader, levelNum, frames, updateAll):
+    """run game
+    * Plays a level with seeded random key presses and measures the sprite update pass
+
+    Args:
+        gameLoader (GameLoader): Loader of the level
+        levelNum (int): Number of the level to play
+        frames (int): Number of frames to simulate
+        updateAll (bool): Update all sprites (before) instead of the changing ones (after)
+
+    Return:
+        updateTimes (list): Seconds spent in the update pass per frame
+        positions (list): Real positions of player and enemies after every frame
+    """
+    random.seed(levelNum)
+    keys = []
+    game = Game(
+        gameLoader, {"currentLvl": levelNum, "maskCount": 0, "deathCount": 0}, keys
+    )
+    updateSprites = game._updateSprites
+    if updateAll:
+        updateSprites = lambda: game.allsprites.update(game.wallGrid)
+    updateTimes = []
+
+    def timedUpdateSprites():
+        start = time.perf_counter()
+        updateSprites()
+        updateTimes.append(time.perf_counter() - start)
+
+    game._updateSprites = timedUpdateSprites
+
+    rand = random.Random(levelNum)
+    moveKeys = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d]
+    positions = []
+    for frame in range(0, frames):
+        if frame % 15 == 0:
+            keys[:] = rand.sample(moveKeys, rand.randint(0, 2))
+        game.update_game()
+        positions.append([sprite.realRect.topleft for sprite in game.actors])
+    return updateTimes, positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sprite update pass")
+    parser.add_argument("--frames", type=int, default=3000, help="frames per run")
+    parser.add_argument("--level", type=int, default=NUM_LEVELS, help="level to play")
+    args = parser.parse_args()
+    frames = args.frames
+    levelNum = args.level
+    logging.disable(logging.CRITICAL)
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    gameLoader = GameLoader()
+
+    game = Game(gameLoader, {"currentLvl": levelNum, "maskCount": 0, "deathCount": 0})
+    print(
+        "level "
+        + str(levelNum)
+        + ": "
+        + str(len(game.allsprites))
+        + " sprites, "
+        + str(len(game.masks) + len(game.actors))
+        + " updated"
+    )
+
+    # Alternate both passes over several rounds, so changing machine load hits both
+    times = {True: [], False: []}
+    for roundNum in range(0, ROUNDS):
+        beforeTimes, beforePositions = run_game(gameLoader, levelNum, frames, True)
+        afterTimes, afterPositions = run_game(gameLoader, levelNum, frames, False)
+        # Both passes have to move everything the same way
+        if beforePositions != afterPositions:
+            raise SystemExit("Update passes differ")
+        times[True].extend(beforeTimes)
+        times[False].extend(afterTimes)
+
+    for name, updateAll in [("before", True), ("after", False)]:
+        updateTimes = sorted(times[updateAll])
+        print(
+            "%-7s median %7.2f us  p90 %7.2f us"
+            % (
+                name,
+                updateTimes[len(updateTimes) // 2] * 1e6,
+                updateTimes[int(len(updateTimes) * 0.9)] * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""bench_wall_collision
+    * Compares the cost of the player's wall collision handling per frame on all levels
+    * Runs the same scripted player movement with the plain list of wall rects, WallGrid and MergedWallGrid
+    * Run from the repository root: python benchmarks/bench_wall_collision.py [--frames N]
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import os
+import sys
+import argparse
+import random
+import time
+import logging
+
+# Run without window and sound, from the repository root
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(sys.path[0])
+
+import pygame
+from gameLoader import GameLoader
+from player import Player
+from wallGrid import WallGrid
+from mergedWallGrid import MergedWallGrid
+from gameConstants import *
+
+
+class WallList(list):
+    """WallList class
+    * Plain list of real wall rects with the WallGrid query interface, tests every rect like before
+
+    Public Methods:
+    * def collidelistall(self, rect)
+    * def collidelist(self, rect)
+    """
+
+    def collidelistall(self, rect):
+        return rect.collidelistall(self)
+
+    def collidelist(self, rect):
+        return rect.collidelist(self)
+
+
+def run_player(realStartPos, walls, frames, seed):
+    """run player
+    * Moves a player with seeded random key presses and measures the wall collision handling
+
+    Args:
+        realStartPos (tuple): Real start position of the player
+        walls (WallList, WallGrid or MergedWallGrid): Walls to collide with
+        frames (int): Number of frames to simulate
+        seed (int): Seed of the key presses
+
+    Return:
+        collisionTime (float): Seconds spent in wall collision handling
+        positions (list): Real position of the player after every frame
+    """
+    player = Player(realStartPos)
+    handleWallCollisions = player._handleWallCollisions
+    collisionTime = [0.0]
+
+    def timedHandleWallCollisions(wallGrid):
+        start = time.perf_counter()
+        handleWallCollisions(wallGrid)
+        collisionTime[0] += time.perf_counter() - start
+
+    player._handleWallCollisions = timedHandleWallCollisions
+
+    rand = random.Random(seed)
+    moveKeys = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d]
+    keys = []
+    positions = []
+    for frame in range(0, frames):
+        if frame % 15 == 0:
+            keys = rand.sample(moveKeys, rand.randint(1, 2))
+        player.move(keys)
+        player.update(walls)
+        positions.append(player.realRect.topleft)
+    return collisionTime[0], positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark wall collision handling")
+    parser.add_argument(
+        "--frames", type=int, default=3000, help="frames per level and variant"
+    )
+    args = parser.parse_args()
+    frames = args.frames
+    logging.disable(logging.CRITICAL)
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    gameLoader = GameLoader()
+
+    print(
+        "%-6s %6s %7s %10s %10s %10s"
+        % ("level", "walls", "merged", "list us", "grid us", "merged us")
+    )
+    totals = [0.0, 0.0, 0.0]
+    for levelNum in range(1, NUM_LEVELS + 1):
+        _, wallGrid, _, realStartPos, _ = gameLoader.load_level(levelNum)
+        realWallRects = list(wallGrid.realWallRects)
+        variants = [
+            WallList(realWallRects),
+            WallGrid(realWallRects),
+            MergedWallGrid(realWallRects),
+        ]
+
+        results = [
+            run_player(realStartPos, walls, frames, levelNum) for walls in variants
+        ]
+        # All variants have to move the player the same way
+        if any(positions != results[0][1] for _, positions in results):
+            raise SystemExit("Level " + str(levelNum) + ": collision outcomes differ")
+
+        perFrame = [collisionTime / frames * 1e6 for collisionTime, _ in results]
+        totals = [total + value for total, value in zip(totals, perFrame)]
+        print(
+            "%-6d %6d %7d %10.2f %10.2f %10.2f"
+            % (
+                levelNum,
+                len(realWallRects),
+                len(variants[2].mergedRects),
+                perFrame[0],
+                perFrame[1],
+                perFrame[2],
+            )
+        )
+    print(
+        "%-6s %6s %7s %10.2f %10.2f %10.2f"
+        % ("mean", "", "", *[total / NUM_LEVELS for total in totals])
+    )
+
+
+if __name__ == "__main__":
+    main()
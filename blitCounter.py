@@ -0,0 +1,59 @@
+"""blitCounter
+    * Holds the BlitCounter class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+
+
+class BlitCounter:
+    """BlitCounter class
+    * Stands in for a pygame.Surface and counts all blits onto it
+    * Every other attribute is taken from the wrapped Surface
+
+    Public Methods:
+    * def blit(self, *args)
+    * def reset(self)
+    """
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.count = 0
+
+    def __getattr__(self, name):
+        return getattr(self.surface, name)
+
+    def blit(self, *args):
+        """blit
+        * Blits onto the wrapped Surface and counts the blit
+
+        Args:
+            *args: Arguments of pygame.Surface.blit
+
+        Return:
+            (pygame.Rect): Affected area, like pygame.Surface.blit
+
+        Test:
+            * count increases by one per call
+            * Wrapped Surface looks the same as if blitted directly
+        """
+        self.count = self.count + 1
+        return self.surface.blit(*args)
+
+    def reset(self):
+        """reset
+        * Sets the blit count back to 0
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * count is 0 after reset
+            * Following blits are counted from 0
+        """
+        self.count = 0
@@ -0,0 +1,119 @@
+"""dirtyRectCoalescer
+    * Holds the DirtyRectCoalescer class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+from gameConstants import *
+
+
+class DirtyRectCoalescer:
+    """DirtyRectCoalescer class
+    * Collects the dirty rects of one frame and merges overlapping and adjacent ones before the display update
+    * Two rects are merged if at most maxWaste (fraction) of the merged rect was not dirty before
+    * Counts rects and pixels that are passed to the display update
+
+    Public Methods:
+    * def add(self, rects, offset=(0, 0))
+    * def flush(self)
+    * def stats(self)
+    """
+
+    def __init__(self, maxWaste=DIRTY_RECT_MAX_WASTE):
+        self.maxWaste = maxWaste
+        self.rects = []
+        # Metrics of the last frame and totals of all frames
+        self.lastRectCount = 0
+        self.lastPixelCount = 0
+        self.frames = 0
+        self.rectsIn = 0
+        self.rectsOut = 0
+        self.pixelsOut = 0
+
+    def add(self, rects, offset=(0, 0)):
+        """add
+        * Adds dirty rects of the current frame
+
+        Args:
+            rects (list): Dirty pygame.Rects
+            offset (tuple, optional): Position of the surface the rects are relative to. Defaults to (0, 0).
+
+        Return:
+            None
+
+        Test:
+            * Added rects are moved by offset
+            * Rects without area are ignored
+        """
+        for rect in rects:
+            if rect.width > 0 and rect.height > 0:
+                self.rects.append(rect.move(offset))
+
+    def flush(self):
+        """flush
+        * Merges all rects added since the last flush and starts a new frame
+
+        Args:
+            None
+
+        Return:
+            mergedRects (list): Rects covering all added rects, for pygame.display.update
+
+        Test:
+            * Every added rect is contained in one of the merged rects
+            * Two overlapping rects of same size and position result in one rect
+        """
+        mergedRects = []
+        for rect in self.rects:
+            i = 0
+            while i < len(mergedRects):
+                other = mergedRects[i]
+                union = rect.union(other)
+                overlap = rect.clip(other)
+                unionArea = union.width * union.height
+                dirtyArea = (
+                    rect.width * rect.height
+                    + other.width * other.height
+                    - overlap.width * overlap.height
+                )
+                if unionArea - dirtyArea <= self.maxWaste * unionArea:
+                    # Merge and check the grown rect against all others again
+                    rect = union
+                    mergedRects.pop(i)
+                    i = 0
+                else:
+                    i = i + 1
+            mergedRects.append(rect)
+
+        self.lastRectCount = len(mergedRects)
+        self.lastPixelCount = sum(r.width * r.height for r in mergedRects)
+        self.frames = self.frames + 1
+        self.rectsIn = self.rectsIn + len(self.rects)
+        self.rectsOut = self.rectsOut + self.lastRectCount
+        self.pixelsOut = self.pixelsOut + self.lastPixelCount
+        self.rects = []
+        return mergedRects
+
+    def stats(self):
+        """stats
+        * Returns the mean number of rects and pixels per frame
+
+        Args:
+            None
+
+        Return:
+            (dict): Frames, rects added and passed on per frame, pixels passed on per frame
+
+        Test:
+            * Values match the flushed frames
+            * No frame flushed does not result in exception
+        """
+        frames = max(self.frames, 1)
+        return {
+            "frames": self.frames,
+            "rectsIn": round(self.rectsIn / frames, 1),
+            "rectsOut": round(self.rectsOut / frames, 1),
+            "pixelsOut": round(self.pixelsOut / frames),
+        }
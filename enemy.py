@@ -6,13 +6,44 @@
         date: 06.06.2021
         version: 0.0.1
 """
-import logging
 import pygame
 from loadsources import *
 from gameConstants import *
 
 
-class Enemy(pygame.sprite.Sprite):
+def next_path_pos(pathPos, speed, pathLength):
+    """next path pos
+    * Calculates the next path index of an enemy walking back and forth along its path
+    * Turns the enemy around at both ends of the path
+
+    Args:
+        pathPos (int): Current path index
+        speed (int): Path indices per frame, negative if walking backwards
+        pathLength (int): Number of positions on the path
+
+    Return:
+        newPathPos (int): Next path index
+        newSpeed (int): Speed after the move, sign changed if the enemy turned around
+
+    Test:
+        * Enemy stays in bonds of the path no matter the speed
+        * Speed changes its sign at each end of the path
+    """
+    newPathPos = pathPos + speed
+    if speed > 0:
+        overshoot = newPathPos - pathLength + 1
+        if overshoot > 0:
+            newPathPos = pathLength - overshoot
+            speed = -speed
+    else:
+        overshoot = -newPathPos
+        if overshoot > 0:
+            newPathPos = overshoot
+            speed = -speed
+    return newPathPos, speed
+
+
+class Enemy(pygame.sprite.DirtySprite):
     """Enemy class
     * Loads animations from all angles (front, back, left, right)
     * Initiates frame and image counter for animation handling
@@ -21,26 +52,49 @@ class Enemy(pygame.sprite.Sprite):
     * Holds path and speed data for path following abilities
 
     Args:
-        pygame (Sprite): Inherits from pygame Sprite class
+        pygame (DirtySprite): Inherits from pygame DirtySprite class
 
     Public Methods:
+    * def reset(self)
     * def get_layer(self)
+    * def interpolate(self, alpha)
     * def update(self, _)
     """
 
     def __init__(self, realStartPos, path):
-        pygame.sprite.Sprite.__init__(self)  # call Sprite initializer
+        pygame.sprite.DirtySprite.__init__(self)  # call DirtySprite initializer
         self.anims = load_enemy_animations(scale=ENEMY_SIZE)
+        self.realStartPos = realStartPos
+        self.rect = self.anims["right"][0].get_rect()
+        self.realArea = pygame.Rect((0, 0), REAL_GAME_SIZE)
+        self.path = path
+        self.startPathPos = path.index(realStartPos)
+        self.reset()
+
+    def reset(self):
+        """reset
+        * Puts the enemy back to its start position on the path in initial state
+        * Keeps the loaded animations
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Enemy is at start position, facing right after reset
+            * Enemy moves the same way as a newly created one after reset
+        """
         self.subFrameCounter = 0
         self.imageCounter = 0
         self.image = self.anims["right"][0]
-        self.realRect = pygame.Rect(realStartPos, (BLOCK_SIZE, BLOCK_SIZE))
-        self.rect = self.anims["right"][0].get_rect()
-        self._calcRect()
+        self.realRect = pygame.Rect(self.realStartPos, (BLOCK_SIZE, BLOCK_SIZE))
+        self.previousRealPos = self.realRect.topleft
+        self._calcRect(self.realRect.topleft)
         self._layer = int(self.realRect.top / BLOCK_SIZE)
-        self.realArea = pygame.Rect((0, 0), REAL_GAME_SIZE)
-        self.path = path
-        self.pathPos = path.index(realStartPos)
+        self.dirty = 1
+        self.pathPos = self.startPathPos
         self.speed = MAX_NPC_SPEED  # TODO: Change according to transparency
         self.facing = "right"
 
@@ -60,12 +114,38 @@ class Enemy(pygame.sprite.Sprite):
         """
         return self._layer
 
-    def _calcRect(self):
+    def interpolate(self, alpha):
+        """interpolate
+        * Places the display rect between the real positions of the last two updates
+        * Marks the enemy to be drawn again if the display position changed
+
+        Args:
+            alpha (float): Fraction of the way from the previous to the current real position (0 to 1)
+
+        Return:
+            None
+
+        Test:
+            * alpha 1 places the display rect like the last update did
+            * alpha 0 places the display rect at the position before the last update
+        """
+        previousPos = self.rect.topleft
+        realX = self.previousRealPos[0] + alpha * (
+            self.realRect.x - self.previousRealPos[0]
+        )
+        realY = self.previousRealPos[1] + alpha * (
+            self.realRect.y - self.previousRealPos[1]
+        )
+        self._calcRect((int(round(realX)), int(round(realY))))
+        if self.rect.topleft != previousPos:
+            self.dirty = 1
+
+    def _calcRect(self, realPos):
         """calc rect (private)
         * Calculates the display rect sizes (gamer view) from real rect sizes (top down view)
 
         Args:
-            None
+            realPos (tuple): Real position (top down view) to translate
 
         Return:
             None
@@ -74,8 +154,8 @@ class Enemy(pygame.sprite.Sprite):
             * Correct translation with different BLOCK_SIZE values
             * No going out of bonds (batch testing)
         """
-        self.rect.x = self.realRect.x - int(round(0.25 * BLOCK_SIZE))
-        self.rect.y = int(round(0.7 * self.realRect.y)) + WALL_HEIGHT - self.rect.height
+        self.rect.x = realPos[0] - int(round(0.25 * BLOCK_SIZE))
+        self.rect.y = int(round(0.7 * realPos[1])) + WALL_HEIGHT - self.rect.height
 
     def _move(self):
         """move (private)
@@ -93,17 +173,7 @@ class Enemy(pygame.sprite.Sprite):
         * Enemy correctly turns on each end of the path
         """
         # Get the next position alongside the path
-        newPathPos = self.pathPos + self.speed
-        if self.speed > 0:
-            overshoot = newPathPos - len(self.path) + 1
-            if overshoot > 0:
-                newPathPos = len(self.path) - overshoot
-                self.speed = -self.speed
-        else:
-            overshoot = -newPathPos
-            if overshoot > 0:
-                newPathPos = overshoot
-                self.speed = -self.speed
+        newPathPos, self.speed = next_path_pos(self.pathPos, self.speed, len(self.path))
 
         # Update facing attribute
         xDiff = self.path[newPathPos][0] - self.path[self.pathPos][0]
@@ -146,6 +216,10 @@ class Enemy(pygame.sprite.Sprite):
             * Enemy is always facing the way it's heading
             * Real rect is correctly translated to rect
         """
+        previousImage = self.image
+        previousPos = self.rect.topleft
+        self.previousRealPos = self.realRect.topleft
+
         # Move Character
         newRealPos = self._move()
         self.realRect.update(newRealPos, self.realRect.size)
@@ -167,7 +241,11 @@ class Enemy(pygame.sprite.Sprite):
             self.subFrameCounter += 1
 
         # Translate real rect to display rect
-        self._calcRect()
+        self._calcRect(self.realRect.topleft)
 
         # Update layer
         self._layer = int(self.realRect.top / BLOCK_SIZE)
+
+        # Draw again only if moved or animated
+        if self.image is not previousImage or self.rect.topleft != previousPos:
+            self.dirty = 1
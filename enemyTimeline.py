@@ -0,0 +1,179 @@
+"""enemyTimeline
+    * Holds the EnemyTimeline class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+from array import array
+import pygame
+from enemy import next_path_pos
+from gameConstants import *
+
+
+class EnemyTimeline:
+    """EnemyTimeline class
+    * Precomputes the real position of every enemy of a level for every frame (tick) of one movement period
+    * Enemies walk back and forth along their paths, so their positions repeat after each enemy's own period
+    * Indexes the tiles every enemy ever touches, so collision checks only look at enemies passing by
+    * Answers for any tick without simulating, tick 0 is the level start and each Game update adds one tick
+
+    Public Methods:
+    * def get_position(self, enemyIdx, tick)
+    * def get_dangerous_tiles(self, tick)
+    * def collide(self, rect, tick)
+    """
+
+    def __init__(self, npcPaths, realNpcStartPositions, speeds):
+        # Real positions of every enemy per tick until the position sequence repeats
+        self.xPositions = []
+        self.yPositions = []
+        # Tick the repeated part starts at and its length, per enemy
+        self.cycleStarts = []
+        self.periods = []
+        # Enemies that touch a tile at any tick, by tile
+        self.tileVisitors = {}
+
+        for enemyIdx in range(0, len(npcPaths)):
+            self._add_enemy(
+                enemyIdx,
+                npcPaths[enemyIdx],
+                realNpcStartPositions[enemyIdx],
+                speeds[enemyIdx],
+            )
+
+    def __len__(self):
+        return len(self.periods)
+
+    def _add_enemy(self, enemyIdx, path, realStartPos, speed):
+        """add enemy (private)
+        * Simulates one enemy until its state (path index, speed) repeats
+        * Stores its positions per tick and adds it to the visitors of all tiles it touches
+
+        Args:
+            enemyIdx (int): Index of the enemy
+            path (NpcPath): Real path of the enemy
+            realStartPos (tuple): Real start position of the enemy on its path
+            speed (int): Start speed of the enemy
+
+        Return:
+            None
+
+        Test:
+            * Positions match the ones of an Enemy updated once per tick
+            * Enemy on a path of one position has a period of 1
+        """
+        xPositions = array("i")
+        yPositions = array("i")
+        visitedTiles = set()
+        seenStates = {}
+        pathPos = path.index(realStartPos)
+        pathLength = len(path)
+        while (pathPos, speed) not in seenStates:
+            seenStates[(pathPos, speed)] = len(xPositions)
+            x, y = path[pathPos]
+            xPositions.append(x)
+            yPositions.append(y)
+            visitedTiles.update(
+                self._get_tiles(pygame.Rect(x, y, BLOCK_SIZE, BLOCK_SIZE))
+            )
+            pathPos, speed = next_path_pos(pathPos, speed, pathLength)
+
+        cycleStart = seenStates[(pathPos, speed)]
+        self.xPositions.append(xPositions)
+        self.yPositions.append(yPositions)
+        self.cycleStarts.append(cycleStart)
+        self.periods.append(len(xPositions) - cycleStart)
+        for tile in visitedTiles:
+            self.tileVisitors.setdefault(tile, []).append(enemyIdx)
+
+    def _get_tiles(self, rect):
+        """get tiles (private)
+        * Determines all tiles a real rect overlaps
+
+        Args:
+            rect (pygame.Rect): Real rect (top down view)
+
+        Return:
+            (list): (x, y) tile coordinates
+
+        Test:
+            * Rect aligned to the tile grid returns one tile
+            * Rect between four tiles returns four tiles
+        """
+        return [
+            (x, y)
+            for y in range(rect.top // BLOCK_SIZE, (rect.bottom - 1) // BLOCK_SIZE + 1)
+            for x in range(rect.left // BLOCK_SIZE, (rect.right - 1) // BLOCK_SIZE + 1)
+        ]
+
+    def get_position(self, enemyIdx, tick):
+        """get position
+        * Looks up the real position of an enemy at a tick
+
+        Args:
+            enemyIdx (int): Index of the enemy
+            tick (int): Number of Game updates since level start
+
+        Return:
+            (tuple): Real position of the enemy
+
+        Test:
+            * Position at tick 0 is the start position
+            * Position at tick + period equals position at tick
+        """
+        cycleStart = self.cycleStarts[enemyIdx]
+        if tick >= cycleStart:
+            tick = cycleStart + (tick - cycleStart) % self.periods[enemyIdx]
+        return self.xPositions[enemyIdx][tick], self.yPositions[enemyIdx][tick]
+
+    def get_dangerous_tiles(self, tick):
+        """get dangerous tiles
+        * Determines all tiles touched by an enemy at a tick
+
+        Args:
+            tick (int): Number of Game updates since level start
+
+        Return:
+            dangerousTiles (set): (x, y) tile coordinates
+
+        Test:
+            * Tiles of every enemy rect at the tick are included
+            * Level without enemies returns empty set
+        """
+        dangerousTiles = set()
+        for enemyIdx in range(0, len(self.periods)):
+            x, y = self.get_position(enemyIdx, tick)
+            dangerousTiles.update(
+                self._get_tiles(pygame.Rect(x, y, BLOCK_SIZE, BLOCK_SIZE))
+            )
+        return dangerousTiles
+
+    def collide(self, rect, tick):
+        """collide
+        * Finds all enemies whose real rects collide with rect at a tick
+        * Only enemies that ever touch a tile below rect are tested
+
+        Args:
+            rect (pygame.Rect): Real rect (top down view) to test
+            tick (int): Number of Game updates since level start
+
+        Return:
+            collidedEnemyIdxs (list): Indices of all colliding enemies
+
+        Test:
+            * Result equals collision test with all Enemy real rects after tick updates
+            * Rect on tiles no enemy ever walks on returns empty list without position lookups
+        """
+        collidedEnemyIdxs = []
+        testedEnemyIdxs = set()
+        for tile in self._get_tiles(rect):
+            for enemyIdx in self.tileVisitors.get(tile, ()):
+                if enemyIdx in testedEnemyIdxs:
+                    continue
+                testedEnemyIdxs.add(enemyIdx)
+                x, y = self.get_position(enemyIdx, tick)
+                if rect.colliderect((x, y, BLOCK_SIZE, BLOCK_SIZE)):
+                    collidedEnemyIdxs.append(enemyIdx)
+        return collidedEnemyIdxs
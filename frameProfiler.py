@@ -0,0 +1,164 @@
+"""frameProfiler
+    * Holds the FrameProfiler class and the percentile function
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import math
+import time
+from collections import deque
+from gameConstants import *
+
+
+def percentile(values, percent):
+    """percentile
+    * Returns the value not exceeded by percent of all values (nearest rank)
+
+    Args:
+        values (list): Measured values
+        percent (float): Percentage between 0 and 100
+
+    Return:
+        (float): Value at the rank, 0.0 if values is empty
+
+    Test:
+        * percentile 100 returns the maximum
+        * percentile 50 of 1, 2, 3 returns 2
+    """
+    values = sorted(values)
+    if not values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(values)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+class FrameProfiler:
+    """FrameProfiler class
+    * Measures the time spent per section (e.g. update, collision, draw) in every frame
+    * Times methods by replacing them on single objects, objects not instrumented run without any timing code
+    * Time of nested sections is only counted for the innermost one, so sections add up to the frame time
+    * Keeps the last historySize frames for percentiles and graphs
+
+    Public Methods:
+    * def instrument(self, obj, methodName, section)
+    * def uninstrument_all(self)
+    * def end_frame(self)
+    * def get_history(self, section)
+    * def percentile(self, section, percent)
+    """
+
+    def __init__(self, sections, historySize=PROFILER_HISTORY_SIZE):
+        self.sections = list(sections)
+        # Seconds per section of the running frame
+        self.current = dict.fromkeys(self.sections, 0.0)
+        # Seconds per section of the last frames, oldest first
+        self.history = {section: deque(maxlen=historySize) for section in self.sections}
+        # Time of nested sections per running section, innermost last
+        self.nestedTimes = []
+        # (object, method name) of all timed methods
+        self.instrumented = []
+
+    def instrument(self, obj, methodName, section):
+        """instrument
+        * Replaces a method of obj (only this object) by one that adds its time to section
+
+        Args:
+            obj (object): Object whose method is timed
+            methodName (string): Name of the method
+            section (string): Section the time is counted for, one of sections
+
+        Return:
+            None
+
+        Test:
+            * Instrumented method returns the same as before
+            * Other objects of the same class are not timed
+        """
+        method = getattr(obj, methodName)
+
+        def timedMethod(*args, **kwargs):
+            start = time.perf_counter()
+            self.nestedTimes.append(0.0)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nestedTime = self.nestedTimes.pop()
+                self.current[section] = self.current[section] + elapsed - nestedTime
+                if self.nestedTimes:
+                    self.nestedTimes[-1] = self.nestedTimes[-1] + elapsed
+
+        setattr(obj, methodName, timedMethod)
+        self.instrumented.append((obj, methodName))
+
+    def uninstrument_all(self):
+        """uninstrument all
+        * Gives all instrumented objects their original methods back
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Methods are not timed anymore
+            * Objects behave the same as before instrumenting
+        """
+        for obj, methodName in reversed(self.instrumented):
+            if methodName in vars(obj):
+                delattr(obj, methodName)
+        self.instrumented = []
+
+    def end_frame(self):
+        """end frame
+        * Stores the times of the running frame and starts a new one
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Every section has one more value in its history
+            * Times of the next frame start at 0
+        """
+        for section in self.sections:
+            self.history[section].append(self.current[section])
+            self.current[section] = 0.0
+
+    def get_history(self, section):
+        """get history
+        * Returns the times of a section in the stored frames
+
+        Args:
+            section (string): Name of the section
+
+        Return:
+            (list): Seconds per frame, oldest first
+
+        Test:
+            * Length is at most historySize
+            * Last value is the time of the last ended frame
+        """
+        return list(self.history[section])
+
+    def percentile(self, section, percent):
+        """percentile
+        * Returns the time of a section not exceeded in percent of the stored frames (nearest rank)
+
+        Args:
+            section (string): Name of the section
+            percent (float): Percentage between 0 and 100
+
+        Return:
+            (float): Seconds, 0.0 if no frame is stored
+
+        Test:
+            * percentile 100 returns the longest stored time
+            * No stored frame returns 0.0
+        """
+        return percentile(self.history[section], percent)
@@ -11,7 +11,9 @@ import pygame
 from gameLoader import GameLoader
 from player import Player
 from enemy import Enemy
-from loadsources import load_collect_sound
+from audioManager import audioManager
+from spatialHash import SpatialHash
+from blitCounter import BlitCounter
 from gameConstants import *
 
 
@@ -19,32 +21,51 @@ class Game:
     """Game class
     * Loads, blits and updates all game objects (Player, Enemies, Walls, Masks, etc.) of one level
     * Handles win, player collision with mask, death
+    * Only draws sprites that changed or are overlapped by changed ones, counts blits per frame
+    * Simulates in fixed ticks, drawing can happen any time in between
 
     Public Methods:
+    * def attach(self, surface, pos)
+    * def enable_profiling(self, profiler)
+    * def reset(self, gameStats)
     * def checkWin(self)
     * def checkDeath(self)
+    * def tick(self)
+    * def draw(self, alpha=1.0)
     * def update_game(self)
     """
 
     def __init__(self, gameLoader, gameStats, pressedKeys=[]):
-        # Init attributes
+        # Init attributes, draw offscreen until attached to the window
         self.screen = pygame.Surface(GAME_SIZE)
+        # Counts blits onto screen, number of last frame in blitCount
+        self.blitCounter = BlitCounter(self.screen)
+        self.blitCount = 0
         self.pressedKeys = pressedKeys
-        self.allsprites = pygame.sprite.LayeredUpdates()
+        # All sprites for drawing, groups by kind for updating
+        self.allsprites = pygame.sprite.LayeredDirty()
+        self.scenery = pygame.sprite.Group()  # Static, never updated
+        self.masks = pygame.sprite.Group()  # Animated
         self.npcs = pygame.sprite.Group()
-        self.masks = pygame.sprite.Group()
+        self.actors = pygame.sprite.Group()  # Moving (npcs and player)
+        # Buckets of masks for collision checks with the player
+        self.maskHash = SpatialHash()
         self.gameStats = gameStats.copy()
         self.gameLoader = gameLoader
         # Load level
         (
             walls,
-            self.realWallRects,
+            self.wallGrid,
             masks,
             realPlayerStartPosition,
             self.realExitRect,
         ) = self.gameLoader.load_level(gameStats["currentLvl"])
+        self.levelMasks = masks
         self.masks.add(masks)
+        for mask in masks:
+            self.maskHash.add(mask)
         self.allsprites.add(masks)
+        self.scenery.add(walls)
         self.allsprites.add(walls)
         # Load all NPCs
         npcPaths, realNpcStartPositions = self.gameLoader.load_npc_paths(
@@ -53,15 +74,138 @@ class Game:
         for i in range(0, len(npcPaths)):
             newEnemy = Enemy(realNpcStartPositions[i], npcPaths[i])
             self.npcs.add(newEnemy)
+            self.actors.add(newEnemy)
             self.allsprites.add(newEnemy)
+        # Precomputed NPC positions for collision checks with the player
+        self.enemyTimeline = self.gameLoader.load_enemy_timeline(
+            gameStats["currentLvl"]
+        )
+        self.tickCount = 0
         # Create Player
         self.player = Player(realPlayerStartPosition)
+        self.actors.add(self.player)
         self.allsprites.add(self.player)
+        self._stackActors()
         self.playerDying = False
         # Create floor (background)
         self.floor = pygame.Surface(GAME_SIZE)
         self.floor.fill(FLOOR_COLOR)
         self.screen.blit(self.floor, (0, 0))
+        self.allsprites.clear(self.screen, self.floor)
+
+    def attach(self, surface, pos):
+        """attach
+        * Draws the game directly into an area of another surface (the window) from now on
+        * Copies what was drawn offscreen so far once, no copy of the game area is needed per frame
+
+        Args:
+            surface (pygame.Surface): Surface to draw into, usually the display surface
+            pos (tuple): Position of the game area on surface
+
+        Return:
+            None
+
+        Test:
+            * Window shows the game area after attaching without blitting game.screen
+            * Dirty areas returned by update_game are relative to pos
+        """
+        gameArea = self.screen
+        self.screen = surface.subsurface(pygame.Rect(pos, GAME_SIZE))
+        self.screen.blit(gameArea, (0, 0))
+        self.blitCounter = BlitCounter(self.screen)
+
+    def enable_profiling(self, profiler):
+        """enable profiling
+        * Times updating, collision checks and drawing of this game with profiler
+        * Games without profiling run no timing code at all
+
+        Args:
+            profiler (FrameProfiler): Profiler with the sections "update", "collision" and "draw"
+
+        Return:
+            None
+
+        Test:
+            * Times of all three sections are counted after update_game
+            * Game behaves the same with and without profiling
+        """
+        profiler.instrument(self, "_updateSprites", "update")
+        profiler.instrument(self.player, "_handleWallCollisions", "collision")
+        profiler.instrument(self, "_handleMaskCollisions", "collision")
+        profiler.instrument(self, "checkDeath", "collision")
+        profiler.instrument(self, "checkWin", "collision")
+        profiler.instrument(self, "draw", "draw")
+
+    def reset(self, gameStats):
+        """reset
+        * Restarts the level without loading it again
+        * Puts player, enemies and all masks back into their state from level start
+        * Walls and all loaded surfaces are reused
+
+        Args:
+            gameStats (dict): Game stats to restart the level with
+
+        Return:
+            None
+
+        Test:
+            * Collected masks are back on the map after reset
+            * Player and enemies are at their start positions after reset
+        """
+        self.gameStats = gameStats.copy()
+        # Put back collected masks
+        for mask in self.levelMasks:
+            mask.reset()
+            self.maskHash.add(mask)
+        self.masks.add(self.levelMasks)
+        self.allsprites.add(self.levelMasks)
+        # Put back player and enemies
+        for npc in self.npcs:
+            npc.reset()
+        self.tickCount = 0
+        self.player.reset()
+        self.playerDying = False
+        self._stackActors()
+        # Start with the floor only, like a newly loaded level
+        self.screen.blit(self.floor, (0, 0))
+        self.allsprites.repaint_rect(self.screen.get_rect())
+
+    def _stackActors(self):
+        """stack actors (private)
+        * Moves the player and then every enemy to its current layer, on top of everything else in it
+        * So within a layer enemies are always drawn over the player, no matter who changed layer last
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Enemy in the same layer as the player is drawn over him
+            * Masks put back by reset are drawn below player and enemies of their layer
+        """
+        self.allsprites.change_layer(self.player, self.player.get_layer())
+        for npc in self.npcs:
+            self.allsprites.change_layer(npc, npc.get_layer())
+
+    def _updateSprites(self):
+        """update sprites (private)
+        * Calls update() methods of animated scenery (masks) and actors (npcs and player)
+        * Static scenery (walls, exit) never changes and is skipped
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Masks are animated and actors move like when updating all sprites
+            * update() of walls is never called
+        """
+        self.masks.update(None)
+        self.actors.update(self.wallGrid)
 
     def _handleMaskCollisions(self):
         """handle mask collisions (private)
@@ -78,42 +222,18 @@ class Game:
             * Collision with mask removes mask on map
             * Collision with mask increases mask counter in bottom bar by one
         """
-        soundCollect = load_collect_sound("Collect_Coin.wav")
         # Get all masks that collide with player
-        collidedMasks = pygame.sprite.spritecollide(
-            self.player, self.masks, True, collided=self._real_did_collide
-        )
+        collidedMasks = self.maskHash.collide(self.player.realRect)
         for collidedMask in collidedMasks:
-            # Remove mask from allsprites group
+            # Remove mask from all groups
+            self.maskHash.remove(collidedMask)
+            self.masks.remove(collidedMask)
             self.allsprites.remove(collidedMask)
             # Coin sound after collecting mask
-            soundCollect.play()
+            audioManager.play_effect("collect")
             # Increment mask count
             self.gameStats["maskCount"] = self.gameStats["maskCount"] + 1
 
-    def _real_did_collide(self, sprite1, sprite2):
-        """real did collide (private)
-        * Replaces the normal sprite collision detection
-        * Determines collision between two Sprites by their real rects (from virtual top down view)
-        * Can be used by pygame.sprite.spritecollide method for real collision detection in 2.5D space
-
-        Args:
-            sprite1 (pygame.sprite.Sprite): One Sprite
-            sprite2 (pygame.sprite.Sprite): The other Sprite
-
-        Return:
-            (bool): True if there is a collision, False if not
-
-        Test:
-            * Collision of real rects returns True
-            * No Collision returns False
-        """
-
-        if sprite1.realRect.colliderect(sprite2.realRect):
-            return True
-        else:
-            return False
-
     def checkWin(self):
         """check win
         * Check if player reached exit
@@ -156,8 +276,8 @@ class Game:
         if self.playerDying and self.player.dyingCounter == 0:
             return True
         # Check if player touched an enemy
-        collidedEnemies = pygame.sprite.spritecollide(
-            self.player, self.npcs, False, collided=self._real_did_collide
+        collidedEnemies = self.enemyTimeline.collide(
+            self.player.realRect, self.tickCount
         )
         if not len(collidedEnemies) == 0 and not self.playerDying:
             if self.player.deathProtectCounter > 0:
@@ -176,42 +296,85 @@ class Game:
         else:
             return False
 
-    def update_game(self):
-        """update game
+    def tick(self):
+        """tick
+        * Advances the simulation by one fixed step of 1 / TICK_RATE seconds
         * Calls the players move method to update his speed
-        * Calls update functions on all sprites
+        * Calls update functions on all changing sprites
         * Handles mask collisions
         * Updates the layer of all movable game objects to keep right perspective
-        * Draws changes to game Surface
+        * Depends only on the pressed keys, never on the time passed since the last step
 
         Args:
             None
 
-        Returns:
-            dirtyAreas(list): List with all updated areas in game for better performance when updating screen
+        Return:
+            None
 
         Test:
             * Collect mask and mask counter has to be changed
-            * Move some game objects and check if perspective is right (because of the layers)
+            * Same pressed keys per tick result in same positions, no matter how often draw is called in between
         """
-        logging.info("Updating changed areas of game...")
         # Update movement based on pressed keys
         self.player.move(self.pressedKeys)
 
-        # Clear the game Surface
-        self.allsprites.clear(self.screen, self.floor)
-        # Call update() methods on all sprites
-        self.allsprites.update(self.realWallRects)
+        # Call update() methods on all changing sprites
+        self._updateSprites()
+        self.tickCount = self.tickCount + 1
         # Check if any collectibles were collected
         self._handleMaskCollisions()
-        # Update the layers of all movable game objects
-        self.allsprites.change_layer(self.player, self.player.get_layer())
-        for npc in self.npcs:
-            self.allsprites.change_layer(npc, npc.get_layer())
-        # Draw the new game Surface
-        dirtyAreas = self.allsprites.draw(self.screen)
+        # Update the layers of all movable game objects if one changed (changing marks them dirty)
+        for sprite in [self.player, *self.npcs]:
+            if sprite.get_layer() != self.allsprites.get_layer_of_sprite(sprite):
+                self._stackActors()
+                break
+        # Sampled trace instead of logging every tick, only a constant is checked if disabled
+        if LOG_TRACE_INTERVAL and self.tickCount % LOG_TRACE_INTERVAL == 0:
+            logging.debug(
+                "Tick %d: player at %s, %d masks left",
+                self.tickCount,
+                self.player.realRect.topleft,
+                len(self.masks),
+            )
+
+    def draw(self, alpha=1.0):
+        """draw
+        * Places player and enemies between their positions of the last two ticks
+        * Draws changes to game Surface
+
+        Args:
+            alpha (float, optional): Time passed since the last tick as fraction of a tick. Defaults to 1.0.
 
-        logging.info("Update changed areas of game successful")
+        Returns:
+            dirtyAreas(list): List with all updated areas in game for better performance when updating screen
+
+        Test:
+            * Move some game objects and check if perspective is right (because of the layers)
+            * Drawing twice with the same alpha returns no dirty areas the second time
+        """
+        for sprite in self.actors:
+            sprite.interpolate(alpha)
+        # Draw dirty sprites and everything they overlap on the game Surface
+        self.blitCounter.reset()
+        dirtyAreas = self.allsprites.draw(self.blitCounter)
+        self.blitCount = self.blitCounter.count
 
         # Return dirty areas
         return dirtyAreas
+
+    def update_game(self):
+        """update game
+        * Advances the simulation by one tick and draws the result
+
+        Args:
+            None
+
+        Returns:
+            dirtyAreas(list): List with all updated areas in game for better performance when updating screen
+
+        Test:
+            * Game Surface looks the same as after tick() and draw()
+            * Collect mask and mask counter has to be changed
+        """
+        self.tick()
+        return self.draw()
@@ -7,7 +7,10 @@
         version: 0.0.1
 """
 # Game Constants
-FRAMERATE = 30
+FRAMERATE = 120  # Max. rendered frames per second, 0 renders as fast as possible
+TICK_RATE = 30  # Simulation steps per second, all speeds and durations count steps
+TICK_DURATION = 1000 / TICK_RATE  # Milliseconds per simulation step
+MAX_TICKS_PER_FRAME = 5  # Steps caught up after a stalled frame, older ones are dropped
 BLOCK_SIZE = 30
 GAME_SIZE = [
     32 * BLOCK_SIZE,
@@ -39,8 +42,57 @@ X_PADDING = 20
 NUM_LEVELS = 11
 FONT_SIZE_BOTTOM_BAR = 40
 FLOOR_COLOR = (155, 188, 160)
+TEXT_COLOR = (231, 231, 231)
 BAR_COLOR = (40, 40, 40)
+SPATIAL_HASH_CELL_SIZE = 2 * BLOCK_SIZE  # Cell size of mask collision buckets
+MERGE_WALL_RECTS = True  # Use MergedWallGrid for wall collisions
+PROFILER_HISTORY_SIZE = 120  # Frames kept by FrameProfiler
+PERF_SECTIONS = ["input", "update", "collision", "draw", "bars", "display", "load"]
+PERF_OVERLAY_POS = (X_PADDING, BAR_HEIGHT + X_PADDING)  # Top left corner on screen
+PERF_GRAPH_BAR_WIDTH = 2  # Pixels per frame in graph
+PERF_OVERLAY_SIZE = (PERF_GRAPH_BAR_WIDTH * PROFILER_HISTORY_SIZE + X_PADDING, 220)
+PERF_OVERLAY_FONT_SIZE = 20
+PERF_GRAPH_MS = 20  # Milliseconds at the top of the graph
+PERF_GRAPH_COLOR = (25, 25, 25)
+PERF_SECTION_COLORS = [
+    (120, 200, 255),
+    (120, 230, 120),
+    (255, 200, 80),
+    (255, 120, 120),
+    (200, 150, 255),
+    (255, 255, 140),
+    (160, 160, 160),
+]
+LOG_FILE = "game.log"
+LOG_MAX_BYTES = 1024 * 1024  # Log file is rotated at this size
+LOG_BACKUP_COUNT = 3  # Number of old log files kept
+LOG_TRACE_INTERVAL = 0  # Log state of every nth tick (debug level), 0 disables tracing
+DIRTY_RECT_MAX_WASTE = 0.3  # Max. fraction of a merged dirty rect that was not dirty
+
+# Level map pixel colors (RGBA)
+WALL_PIXEL = (0, 0, 0, 255)
+EXIT_PIXEL = (0, 255, 0, 255)
+MASK_PIXEL = (255, 0, 0, 255)
+START_PIXEL = (0, 0, 255, 255)
+NPC_PATH_PIXEL = (0, 0, 0, 255)
+NPC_PATH_ALT_PIXEL = (0, 0, 255, 255)
+NPC_START_PIXEL = (0, 255, 0, 255)
 
 ASSETS_LOCATION = "assets"
 LEVEL_LOCATION = "levels"
 SAVEFILE_NAME = "save.json"
+SOUND_EFFECTS = {"collect": "Collect_Coin.wav"}  # Sound effects loaded at start
+AUDIO_RESERVED_CHANNELS = 4  # Mixer channels reserved for sound effects
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024  # Max. bytes of loaded surfaces kept in memory
+TEXT_CACHE_SIZE = 32  # Max. number of rendered texts kept in memory
+LEVEL_CACHE_LOCATION = "level_cache"
+LEVEL_CACHE_VERSION = 2  # Increment if the compiled level format changes
+LEVEL_CACHE_FIELDS = [
+    "walls",
+    "exits",
+    "masks",
+    "start",
+    "npcPaths",
+    "npcPathLengths",
+    "npcStarts",
+]
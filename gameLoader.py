@@ -7,11 +7,18 @@
         version: 0.0.1
 """
 import logging
+import hashlib
+import zipfile
 import pygame
+import numpy as np
 from PIL import Image
 import os
 from loadsources import load_image, load_animation
 from gameObject import GameObject, AnimatedGameObject
+from npcPath import NpcPath
+from enemyTimeline import EnemyTimeline
+from wallGrid import WallGrid
+from mergedWallGrid import MergedWallGrid
 from gameConstants import *
 
 
@@ -19,10 +26,12 @@ class GameLoader:
     """GameLoader class
     * Holds all methods for loading level data from .png files
     * Loads all game assets as attributes once for better run time performance
+    * Compiles every level once into a binary cache file, later loads skip image parsing
 
     Public Methods:
     * def load_level(self, levelNum))
     * def load_npc_paths(self)
+    * def load_enemy_timeline(self, levelNum)
     """
 
     def __init__(self):
@@ -39,35 +48,318 @@ class GameLoader:
         self.maskAnim = load_animation(
             "game_objects/mask_anim", scale=(BLOCK_SIZE, WALL_HEIGHT)
         )
+        # Compiled level data of this session, by level number
+        self.compiledLevels = {}
+        # Precomputed enemy positions of this session, by level number
+        self.enemyTimelines = {}
+        # Wall row surfaces of this session, by level number and row
+        self.wallRowSurfs = {}
 
     def load_level(self, levelNum):
         """load level
-            * Parses level map from map[x].png file
-            * Loads player start and exit position from .png file
-            * Throws error if design rules are violated
+            * Gets the compiled level map (parsed from map[x].png file if not cached)
+            * Loads player start and exit position
             * Creates Sprites and realRects for all desired GameObjects for later blitting and collision handling
 
         Args:
             levelNum (int): Number of the level that needs to be loaded
 
         Raises:
-            SystemExit: Map Load Error
             SystemExit: Map Load Error
             SystemExit: Map Parse Error
 
         Returns:
-           wallSprites (list): Each black pixel of the .png is part of the wall and is added to sprites, all sprites in wallSprites list
-           realWallRects (list): List of all real wall rectangles
+           wallSprites (list): Exit sprites and one sprite per row holding all walls (black pixels) of that row
+           wallGrid (WallGrid): Tile occupancy grid of all real wall rectangles (MergedWallGrid if MERGE_WALL_RECTS)
            maskSprites (list): List of all mask sprites
            realStartPos (tuple): Real start position is calculated
            realExitRect (pygame.Rect): Exit rectangle with real sizes
 
         Test:
-            * Create .png with black lines, wallsprites list and realWallRects list should be filled according to the .png file
+            * Create .png with black lines, wallSprites list should hold one sprite per row and wallGrid every wall
+            * Create .png file without blue pixel this results in exception
+        """
+        logging.info("Loading level " + str(levelNum) + "...")
+
+        level = self._load_compiled_level(levelNum)
+
+        # Create empty sprite and realRect list
+        wallSprites = []
+        realWallRects = []
+        maskSprites = []
+        realExitRect = None
+
+        # Create exit and collect walls in map order (keeps realWallRects ordered by position)
+        exitTiles = set(map(tuple, level["exits"].tolist()))
+        staticTiles = level["walls"].tolist() + level["exits"].tolist()
+        staticTiles.sort(key=lambda tile: (tile[1], tile[0]))
+        wallColumns = {}
+        for x, y in staticTiles:
+            realPos = (x * BLOCK_SIZE, y * BLOCK_SIZE)
+            if (x, y) in exitTiles:
+                exitBottom = GameObject(self.exitBottomAsset, realPos)
+                exitTop = GameObject(self.exitTopAsset, realPos)
+                # Display top of exit one layer higher for right perspective
+                exitTop.moveLayer(1)
+                wallSprites.append([exitBottom, exitTop])
+                realExitRect = pygame.Rect(realPos, (BLOCK_SIZE, BLOCK_SIZE))
+            else:
+                wallColumns.setdefault(y, []).append(x)
+                realWallRects.append(pygame.Rect(realPos, (BLOCK_SIZE, BLOCK_SIZE)))
+        # Create one sprite per row holding all walls of the row (after exits to keep drawing order)
+        for y, columns in wallColumns.items():
+            wallSprites.append(self._create_wall_row(levelNum, y, columns))
+        # Create masks
+        for x, y in level["masks"].tolist():
+            newMask = AnimatedGameObject(
+                self.maskAnim, (x * BLOCK_SIZE, y * BLOCK_SIZE)
+            )
+            maskSprites.append(newMask)
+        realStartPos = [c * BLOCK_SIZE for c in level["start"].tolist()]
+
+        # Walls are still drawn tile by tile, merging only speeds up collision queries
+        if MERGE_WALL_RECTS:
+            wallGrid = MergedWallGrid(realWallRects)
+        else:
+            wallGrid = WallGrid(realWallRects)
+
+        logging.info("Loading level " + str(levelNum) + " was successful")
+
+        return (
+            wallSprites,
+            wallGrid,
+            maskSprites,
+            realStartPos,
+            realExitRect,
+        )
+
+    def _create_wall_row(self, levelNum, row, columns):
+        """create wall row (private)
+        * Blits all walls of one map row onto one surface (once per session), walls of one row never overlap
+        * Row sprite has the layer of the row, like every single wall had
+
+        Args:
+            levelNum (int): Number of the level the row belongs to
+            row (int): Map row (y tile coordinate)
+            columns (list): Ascending map columns (x tile coordinates) of all walls in the row
+
+        Return:
+            wallRow (GameObject): Sprite of all walls of the row
+
+        Test:
+            * Drawn row looks the same as all single walls drawn at their positions
+            * Loading the level again reuses the surface
+        """
+        left = columns[0]
+        rowSurf = self.wallRowSurfs.get((levelNum, row))
+        if rowSurf is None:
+            rowSurf = pygame.Surface(
+                ((columns[-1] - left + 1) * BLOCK_SIZE, WALL_HEIGHT),
+                pygame.SRCALPHA,
+                self.wallAsset,
+            )
+            for x in columns:
+                rowSurf.blit(self.wallAsset, ((x - left) * BLOCK_SIZE, 0))
+            self.wallRowSurfs[(levelNum, row)] = rowSurf
+        return GameObject(rowSurf, (left * BLOCK_SIZE, row * BLOCK_SIZE))
+
+    def load_npc_paths(self, levelNum):
+        """load npc paths
+        * Gets the compiled Enemy paths (parsed from all npc[x].png files of one level if not cached)
+        * Translates them into real paths for the Enemies
+        * Reads all start positions of said Enemies
+
+        Args:
+            levelNum (int): Number of the level that needs to be loaded
+
+        Raises:
+            SystemExit: NPC Path Load Error
+            SystemExit: NPC Path Parse Error
+
+        Returns:
+           npcPaths (list): List of all position pixels of loaded paths
+           npcStartPoss (list): List of all Enemy starting points
+
+        Test:
+            * Create .png file with enemy path, path should be saved in npcPaths
+            * On enemy path mark one block with green color, npcStartPoss should contain the position of the colored block
+        """
+        logging.info("Loading NPC paths for level " + str(levelNum) + "...")
+
+        level = self._load_compiled_level(levelNum)
+
+        npcPaths = []
+        npcStartPoss = []
+        pixPaths = np.split(level["npcPaths"], np.cumsum(level["npcPathLengths"])[:-1])
+        for pixPath, startPixPos in zip(pixPaths, level["npcStarts"].tolist()):
+            # Translate pixel path and start pos to real npc path according to BLOCK_SIZE
+            npcPaths.append(self._pix_to_real_path(list(map(tuple, pixPath.tolist()))))
+            npcStartPoss.append(
+                (startPixPos[0] * BLOCK_SIZE, startPixPos[1] * BLOCK_SIZE)
+            )
+
+        logging.info("Loading NPC paths for level " + str(levelNum) + " was successful")
+
+        return npcPaths, npcStartPoss
+
+    def load_enemy_timeline(self, levelNum):
+        """load enemy timeline
+        * Gets the precomputed positions of all Enemies of a level for every tick (computed once per session)
+        * Enemies are in the same order as the paths returned by load_npc_paths
+
+        Args:
+            levelNum (int): Number of the level that needs to be loaded
+
+        Raises:
+            SystemExit: NPC Path Load Error
+            SystemExit: NPC Path Parse Error
+
+        Returns:
+           enemyTimeline (EnemyTimeline): Positions of all Enemies starting with MAX_NPC_SPEED
+
+        Test:
+            * Positions match the ones of the Enemies of a Game after the same number of updates
+            * Second call returns the same object without simulating again
+        """
+        if levelNum in self.enemyTimelines:
+            return self.enemyTimelines[levelNum]
+
+        logging.info("Precomputing enemy timeline for level " + str(levelNum) + "...")
+        npcPaths, npcStartPoss = self.load_npc_paths(levelNum)
+        enemyTimeline = EnemyTimeline(
+            npcPaths, npcStartPoss, [MAX_NPC_SPEED] * len(npcPaths)
+        )
+        self.enemyTimelines[levelNum] = enemyTimeline
+        logging.info(
+            "Precomputing enemy timeline for level "
+            + str(levelNum)
+            + " was successful, periods: "
+            + str(enemyTimeline.periods)
+        )
+
+        return enemyTimeline
+
+    def _load_compiled_level(self, levelNum):
+        """load compiled level (private)
+        * Returns the compiled data of a level, compiles it only if the source images changed
+        * Looks up this session first, then the level cache file, then parses the .png files
+
+        Args:
+            levelNum (int): Number of the level that needs to be loaded
+
+        Return:
+            level (dict): Tile coordinates of walls, exits, masks, start and NPC paths as numpy arrays
+
+        Test:
+            * Second call does not open any .png file
+            * Changing a map or npc .png file results in the level being compiled again
+        """
+        if levelNum in self.compiledLevels:
+            return self.compiledLevels[levelNum]
+
+        cacheKey = self._level_cache_key(levelNum)
+        cachePath = os.path.join(
+            ASSETS_LOCATION, LEVEL_CACHE_LOCATION, "level_" + str(levelNum) + ".npz"
+        )
+
+        # Try to read the compiled level from the cache file
+        level = None
+        try:
+            with np.load(cachePath) as cacheFile:
+                if str(cacheFile["key"]) == cacheKey:
+                    level = {name: cacheFile[name] for name in LEVEL_CACHE_FIELDS}
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            pass
+
+        if level is None:
+            logging.info("Compiling level " + str(levelNum) + " from image files...")
+            level = self._compile_level(levelNum)
+            # Write cache file, a failure only costs compiling the level again next time
+            try:
+                os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+                tmpPath = cachePath + ".tmp"
+                with open(tmpPath, "wb") as cacheFile:
+                    np.savez(cacheFile, key=np.array(cacheKey), **level)
+                os.replace(tmpPath, cachePath)
+            except OSError as message:
+                logging.warning("Cannot write level cache file: " + str(message))
+
+        self.compiledLevels[levelNum] = level
+        return level
+
+    def _level_cache_key(self, levelNum):
+        """level cache key (private)
+        * Hashes the content of all source images of a level
+
+        Args:
+            levelNum (int): Number of the level
+
+        Return:
+            (str): Hex digest identifying the current version of the level files
+
+        Test:
+            * Same files result in same key
+            * Changing one byte of any map or npc .png file changes the key
+        """
+        levelPath = os.path.join(
+            ASSETS_LOCATION, LEVEL_LOCATION, "level_" + str(levelNum)
+        )
+        keyHash = hashlib.sha1(str(LEVEL_CACHE_VERSION).encode())
+        filesList = sorted(os.listdir(levelPath))
+        for file in filesList:
+            filename = os.fsdecode(file)
+            if not filename.endswith(".png"):
+                continue
+            keyHash.update(filename.encode())
+            with open(os.path.join(levelPath, filename), "rb") as sourceFile:
+                keyHash.update(sourceFile.read())
+        return keyHash.hexdigest()
+
+    def _compile_level(self, levelNum):
+        """compile level (private)
+        * Parses level map from map[x].png and all Enemy paths from npc[x].png files
+        * Throws error if design rules are violated
+
+        Args:
+            levelNum (int): Number of the level that needs to be compiled
+
+        Raises:
+            SystemExit: Map Load Error
+            SystemExit: Map Parse Error
+            SystemExit: NPC Path Load Error
+            SystemExit: NPC Path Parse Error
+
+        Return:
+            level (dict): Tile coordinates of walls, exits, masks, start and NPC paths as numpy arrays
+
+        Test:
+            * Compiled tiles match the colored pixels of the .png files
             * Create .png file without blue pixel this results in exception
         """
-        logging.info("Loading level " + str(levelNum) + " from image file...")
+        level = self._compile_level_map(levelNum)
+        level.update(self._compile_npc_paths(levelNum))
+        return level
+
+    def _compile_level_map(self, levelNum):
+        """compile level map (private)
+        * Parses level map from map[x].png file
+        * Finds player start and exit position
+        * Throws error if design rules are violated
+
+        Args:
+            levelNum (int): Number of the level that needs to be compiled
 
+        Raises:
+            SystemExit: Map Load Error
+            SystemExit: Map Parse Error
+
+        Return:
+            level (dict): Tile coordinates of walls, exits, masks and start
+
+        Test:
+            * Create .png with black lines, walls array should be filled according to the .png file
+            * Create .png file without blue pixel this results in exception
+        """
         # Get path to level map file
         levelPath = os.path.join(
             ASSETS_LOCATION,
@@ -89,52 +381,26 @@ class GameLoader:
             )
             raise SystemExit("Map Load Error")
 
-        # Get RGBA data as list of pixel values
-        levelData = levelMap.getdata()
-
-        # Create empty sprite and realRect list
-        wallSprites = []
-        realWallRects = []
-        maskSprites = []
-        realStartPos = None
-        realExitRect = None
+        # Get RGBA data as (y, x, channel) array of pixel values
+        levelData = np.asarray(levelMap)
+
+        # Find all tiles of each kind at once, argwhere returns them in row-major order
+        level = {}
+        for name, pixel in [
+            ("walls", WALL_PIXEL),
+            ("exits", EXIT_PIXEL),
+            ("masks", MASK_PIXEL),
+            ("start", START_PIXEL),
+        ]:
+            # Swap (y, x) to (x, y) tile coordinates
+            tiles = np.argwhere(np.all(levelData == pixel, axis=-1))[:, ::-1]
+            level[name] = tiles.astype(np.int16)
 
-        # Loop over every pixel
-        for i, pix in enumerate(levelData):
-            # If map pixel is black, draw wall
-            if pix == (0, 0, 0, 255):
-                x = i % 32
-                y = int(i / 32)
-                realWallPosition = (x * BLOCK_SIZE, y * BLOCK_SIZE)
-                newWall = GameObject(self.wallAsset, realWallPosition)
-                wallSprites.append(newWall)
-                realWallRects.append(newWall.realRect)
-            # If map pixel is green, draw exit
-            if pix == (0, 255, 0, 255):
-                x = i % 32
-                y = int(i / 32)
-                realExitPos = (x * BLOCK_SIZE, y * BLOCK_SIZE)
-                exitBottom = GameObject(self.exitBottomAsset, realExitPos)
-                exitTop = GameObject(self.exitTopAsset, realExitPos)
-                # Display top of exit one layer higher for right perspective
-                exitTop.moveLayer(1)
-                wallSprites.append([exitBottom, exitTop])
-                realExitRect = pygame.Rect(realExitPos, (BLOCK_SIZE, BLOCK_SIZE))
-            # If map pixel is red, draw mask
-            elif pix == (255, 0, 0, 255):
-                x = i % 32
-                y = int(i / 32)
-                realMaskPos = (x * BLOCK_SIZE, y * BLOCK_SIZE)
-                newMask = AnimatedGameObject(self.maskAnim, realMaskPos)
-                maskSprites.append(newMask)
-            # If map pixel is blue, set player start position
-            elif pix == (0, 0, 255, 255):
-                x = i % 32
-                y = int(i / 32)
-                realStartPos = [c * BLOCK_SIZE for c in [x, y]]
+        # Close level map image
+        levelMap.close()
 
         # Check if start (blue) pixel was found, abort if not
-        if realStartPos == None:
+        if len(level["start"]) == 0:
             logging.error(
                 "Level "
                 + str(levelNum)
@@ -142,57 +408,41 @@ class GameLoader:
             )
             raise SystemExit("Map Parse Error")
         # Check if exit (green) pixel was found, abort if not
-        if realStartPos == None:
+        if len(level["exits"]) == 0:
             logging.error("Level " + str(levelNum) + " map has no exit (green) pixel")
             raise SystemExit("Map Parse Error")
 
-        # Close level map image
-        levelMap.close()
-
-        logging.info(
-            "Loading level " + str(levelNum) + " from image file was successful"
-        )
+        # Last blue pixel is the start position
+        level["start"] = level["start"][-1]
 
-        return (
-            wallSprites,
-            realWallRects,
-            maskSprites,
-            realStartPos,
-            realExitRect,
-        )
+        return level
 
-    def load_npc_paths(self, levelNum):
-        """load npc paths
+    def _compile_npc_paths(self, levelNum):
+        """compile npc paths (private)
         * Parses Enemy paths from all npc[x].png files of one level
-        * Creates Enemys with respective paths for all .png files
-        * Reads all start positions of saif Enemies
+        * Reads all start positions of said Enemies
 
         Args:
-            levelNum (int): Number of the level that needs to be loaded
+            levelNum (int): Number of the level that needs to be compiled
 
         Raises:
             SystemExit: NPC Path Load Error
-            SystemExit: NPC Path Load Error
+            SystemExit: NPC Path Parse Error
 
-        Returns:
-           npcPaths (list): List of all position pixels of loaded paths
-           npcStartPoss (list): List of all Enemy starting points
+        Return:
+            level (dict): Concatenated pixel paths, their lengths and the start pixel of each path
 
         Test:
             * Create .png file with enemy path, path should be saved in npcPaths
-            * On enemy path mark one block with green color, npcStartPoss should contain the position of the colored block
+            * On enemy path mark one block with green color, npcStarts should contain the position of the colored block
         """
-        logging.info(
-            "Loading NPC paths for level " + str(levelNum) + " from image files..."
-        )
-
         # Get path to level directory
         levelPath = os.path.join(
             ASSETS_LOCATION, LEVEL_LOCATION, "level_" + str(levelNum)
         )
 
-        npcPaths = []
-        npcStartPoss = []
+        pixPaths = []
+        npcStartPixPoss = []
         # Get list of all files in level directory
         filesList = os.listdir(levelPath)
         # Sort by name
@@ -221,162 +471,199 @@ class GameLoader:
                 )
                 raise SystemExit("NPC Path Load Error")
 
-            # Get RGBA data as list of pixel values
-            pathData = npcPathImg.getdata()
-
-            # Search for start pixel (green)
-            startPixPos = None
-            for i, pix in enumerate(pathData):
-                # If start (green) pixel is found, safe it and break
-                if pix == (0, 255, 0, 255):
-                    x = i % 32
-                    y = int(i / 32)
-                    startPixPos = (x, y)
-                    break
+            # Get RGBA data as (y, x, channel) array of pixel values
+            pathData = np.asarray(npcPathImg)
+            # Bitmap of all pixels the path may lead over (black or blue)
+            pathMap = np.all(pathData == NPC_PATH_PIXEL, axis=-1) | np.all(
+                pathData == NPC_PATH_ALT_PIXEL, axis=-1
+            )
+
+            # Search for start pixel (green), first one in row-major order
+            startPixPoss = np.argwhere(np.all(pathData == NPC_START_PIXEL, axis=-1))
 
             # Check if start pixel was found, abort if not
-            if startPixPos == None:
+            if len(startPixPoss) == 0:
                 logging.error(
                     "NPC path " + str(filename) + " has no starting (green) pixel"
                 )
                 raise SystemExit("NPC Path Load Error")
+            startPixPos = (int(startPixPoss[0][1]), int(startPixPoss[0][0]))
 
             # Trace the pixel path, starting from startPixPos
-            pixPath = []
-            self._trace_and_append_pixels(pathData, pixPath, startPixPos)
-
-            # Translalte pixle path and start pos to real npc path according to BLOCK_SIZE
-            npcPath = self._pix_to_real_path(pixPath)
-            npcStartPos = (
-                startPixPos[0] * BLOCK_SIZE,
-                startPixPos[1] * BLOCK_SIZE,
-            )
+            pixPath = self._trace_pixel_path(pathMap, startPixPos)
 
             # Append all npc data
-            npcPaths.append(npcPath)
-            npcStartPoss.append(npcStartPos)
+            pixPaths.append(pixPath)
+            npcStartPixPoss.append(startPixPos)
 
             npcPathImg.close()
 
-        logging.info(
-            "Loading NPC paths for level "
-            + str(levelNum)
-            + " from image files was successful"
-        )
+        return {
+            "npcPaths": np.array(
+                [pos for pixPath in pixPaths for pos in pixPath], dtype=np.int16
+            ).reshape(-1, 2),
+            "npcPathLengths": np.array([len(p) for p in pixPaths], dtype=np.int32),
+            "npcStarts": np.array(npcStartPixPoss, dtype=np.int16).reshape(-1, 2),
+        }
 
-        return npcPaths, npcStartPoss
-
-    def _trace_and_append_pixels(
-        self, pathData, listToAppend, pixPos, ignorePixels=[], appendBackwards=True
-    ):
-        """trace and append pixels
-        * Recursive path finding algorithm for tracing a black line in a loaded .png image
+    def _trace_pixel_path(self, pathMap, startPixPos):
+        """trace pixel path (private)
+        * Iterative path finding algorithm for tracing a black line in a loaded .png image
+        * Both directions are traced from the start pixel, the first one is reversed and put in front
 
         Args:
-            pathData (ImagineCore): pixel data of npc .png file
-            listToAppend (list): List to append current found pixel to
-            pixPos (tuple): Position of this pixel
-            ignorePixels (list, optional): List of all pixels that were already taken into account. Defaults to [].
-            appendBackwards (bool, optional): Determines order to append items. Defaults to True.
+            pathMap (numpy.ndarray): (y, x) bitmap with True for every pixel of the path
+            startPixPos (tuple): Position of the start pixel
 
         Raises:
-            SystemExit: [description]
+            SystemExit: NPC Path Parse Error
 
         Return:
-            None
+            pixPath (list): All pixel positions of the path from one end to the other
 
         Test:
             * Parse .png file with path on sides of image
-            * Parse narrow paths
+            * Parse very long paths (no recursion limit)
         """
+        branchStarts = self._path_neighbors(pathMap, startPixPos, {startPixPos})
 
-        # Check every neighboring pixel if it's part of the path
-        neighborsPos = []
-        for x in range(pixPos[0] - 1, pixPos[0] + 2):
-            if x > 31:
+        # First branch is traced towards the start pixel, second one away from it
+        pixPath = []
+        if len(branchStarts) > 0:
+            pixPath.extend(
+                reversed(self._walk_path(pathMap, startPixPos, branchStarts[0]))
+            )
+        pixPath.append(startPixPos)
+        if len(branchStarts) > 1:
+            pixPath.extend(self._walk_path(pathMap, startPixPos, branchStarts[1]))
+
+        return pixPath
+
+    def _walk_path(self, pathMap, fromPixPos, pixPos):
+        """walk path (private)
+        * Follows a path from pixPos without going back to the pixels it came from
+        * At junctions both branches are traced and the longer one is chosen (the first one if equal)
+        * Uses an explicit junction stack instead of recursion
+
+        Args:
+            pathMap (numpy.ndarray): (y, x) bitmap with True for every pixel of the path
+            fromPixPos (tuple): Position of the pixel the walk comes from
+            pixPos (tuple): Position of the first pixel of the walk
+
+        Raises:
+            SystemExit: NPC Path Parse Error
+
+        Return:
+            walkedPixels (list): All pixel positions from pixPos to the end of the path
+
+        Test:
+            * Paths with corners contain every pixel of the corner
+            * Run time grows linear with the path length
+        """
+        visitedPixels = {fromPixPos}
+        # Unresolved junctions: [pixels walked up to it, second branch start, first branch]
+        junctions = []
+        walkedPixels = []
+        while True:
+            visitedPixels.add(pixPos)
+            walkedPixels.append(pixPos)
+            neighborsPos = self._path_neighbors(pathMap, pixPos, visitedPixels)
+
+            # Trace further path
+            if len(neighborsPos) == 1:
+                pixPos = neighborsPos[0]
+                continue
+            # If there's more than one neighbor, walk around the corner or trace first branch
+            elif len(neighborsPos) == 2:
+                cornerPos = self._corner_pixel(pathMap, neighborsPos, visitedPixels)
+                if cornerPos is not None:
+                    pixPos = cornerPos
+                else:
+                    junctions.append([walkedPixels, neighborsPos[1], None])
+                    walkedPixels = []
+                    pixPos = neighborsPos[0]
                 continue
-            for y in range(pixPos[1] - 1, pixPos[1] + 2):
-                if y > 30:
-                    continue
+
+            # End of path is reached, resolve junctions until a second branch is left to trace
+            branchPixels = walkedPixels
+            while True:
+                if len(junctions) == 0:
+                    return branchPixels
+                # Branch pixels are no longer part of the way to the junction
+                visitedPixels.difference_update(branchPixels)
+                junction = junctions[-1]
+                if junction[2] is None:
+                    junction[2] = branchPixels
+                    walkedPixels = []
+                    pixPos = junction[1]
+                    break
+                # Choose longer branch
+                junctions.pop()
+                if len(junction[2]) >= len(branchPixels):
+                    branchPixels = junction[2]
+                branchPixels = junction[0] + branchPixels
+
+    def _corner_pixel(self, pathMap, neighborsPos, visitedPixels):
+        """corner pixel (private)
+        * Decides between two neighboring candidates without tracing both branches
+        * If one candidate only leads on to the other one, going over it first is never shorter
+
+        Args:
+            pathMap (numpy.ndarray): (y, x) bitmap with True for every pixel of the path
+            neighborsPos (list): The two candidates for the next pixel
+            visitedPixels (set): All pixels on the way to the candidates
+
+        Raises:
+            SystemExit: NPC Path Parse Error
+
+        Return:
+            (tuple): Candidate to go to next, None if both branches have to be traced
+
+        Test:
+            * Candidate in the inner corner of an L-shaped path is returned
+            * Two candidates leading into different directions return None
+        """
+        pos0, pos1 = neighborsPos
+        if max(abs(pos0[0] - pos1[0]), abs(pos0[1] - pos1[1])) > 1:
+            return None
+        if self._path_neighbors(pathMap, pos0, visitedPixels) == [pos1]:
+            return pos0
+        if self._path_neighbors(pathMap, pos1, visitedPixels) == [pos0]:
+            return pos1
+        return None
+
+    def _path_neighbors(self, pathMap, pixPos, ignorePixels):
+        """path neighbors (private)
+        * Finds all neighboring pixels of pixPos that are part of the path
+
+        Args:
+            pathMap (numpy.ndarray): (y, x) bitmap with True for every pixel of the path
+            pixPos (tuple): Position of this pixel
+            ignorePixels (set): All pixels that were already taken into account
+
+        Raises:
+            SystemExit: NPC Path Parse Error
+
+        Return:
+            neighborsPos (list): Up to two neighbor positions, column by column
+
+        Test:
+            * Pixels on the sides of the image only get neighbors within the image
+            * Pixel with more than two new neighbors results in exception
+        """
+        height, width = pathMap.shape
+        neighborsPos = []
+        for x in range(max(pixPos[0] - 1, 0), min(pixPos[0] + 2, width)):
+            for y in range(max(pixPos[1] - 1, 0), min(pixPos[1] + 2, height)):
                 if (
-                    not (x, y) == pixPos
+                    pathMap[y, x]
+                    and not (x, y) == pixPos
                     and not (x, y) in ignorePixels
-                    and pathData.getpixel((x, y)) in [(0, 0, 0, 255), (0, 0, 255, 255)]
                 ):
                     neighborsPos.append((x, y))
 
-        # Check if end of path is reached
-        if len(neighborsPos) == 0:
-            listToAppend.append(pixPos)
-            return
-
-        # Trace further path, append to listToAppend
-        elif len(neighborsPos) == 1:
-            if not appendBackwards:
-                listToAppend.append(pixPos)
-            self._trace_and_append_pixels(
-                pathData,
-                listToAppend,
-                neighborsPos[0],
-                ignorePixels=ignorePixels + [pixPos],
-                appendBackwards=appendBackwards,
-            )
-            if appendBackwards:
-                listToAppend.append(pixPos)
-
-        # If there's more than one neighbor...
-        elif len(neighborsPos) == 2:
-            # ...because we are the start pixel, trace both paths
-            if len(ignorePixels) == 0:
-                self._trace_and_append_pixels(
-                    pathData,
-                    listToAppend,
-                    neighborsPos[0],
-                    ignorePixels=ignorePixels + [pixPos],
-                    appendBackwards=True,
-                )
-                listToAppend.append(pixPos)
-                self._trace_and_append_pixels(
-                    pathData,
-                    listToAppend,
-                    neighborsPos[1],
-                    ignorePixels=ignorePixels + [pixPos],
-                    appendBackwards=False,
-                )
-            # ...because there is a corner, trace both paths and choose longer one
-            else:
-                if not appendBackwards:
-                    listToAppend.append(pixPos)
-
-                # Set up counters for length determination
-                path0 = []
-                path1 = []
-                self._trace_and_append_pixels(
-                    pathData,
-                    path0,
-                    neighborsPos[0],
-                    ignorePixels=ignorePixels + [pixPos],
-                    appendBackwards=appendBackwards,
-                )
-                self._trace_and_append_pixels(
-                    pathData,
-                    path1,
-                    neighborsPos[1],
-                    ignorePixels=ignorePixels + [pixPos],
-                    appendBackwards=appendBackwards,
-                )
-
-                # Choose longer path
-                if len(path0) >= len(path1):
-                    listToAppend.extend(path0)
-                else:
-                    listToAppend.extend(path1)
-
-                if appendBackwards:
-                    listToAppend.append(pixPos)
-
         # If there's more than 2 neighbors, error!
-        else:
+        if len(neighborsPos) > 2:
             logging.error(
                 "Pixel with position "
                 + str(pixPos)
@@ -384,40 +671,18 @@ class GameLoader:
             )
             raise SystemExit("NPC Path Parse Error")
 
+        return neighborsPos
+
     def _pix_to_real_path(self, pixPath):
         """pix to real path
         * Translates pixel positions in .png file to actual blitting positions
 
         Args:
-            pixPath ([type]): path in form of pixel coordinates
+            pixPath (list): path in form of pixel coordinates
 
         Return:
-            realPath (type): path in form of real pixel coordinates
+            realPath (NpcPath): path in form of real pixel coordinates, stored segment by segment
 
-        Test: Same as for _trace_and_append_pixels
+        Test: Same as for _trace_pixel_path
         """
-        # Creates a list of real positions from a list of pixel positions
-
-        realPath = []
-        for i in range(0, len(pixPath) - 1):
-            xPix = pixPath[i][0]
-            yPix = pixPath[i][1]
-            xRealStart = BLOCK_SIZE * xPix
-            yRealStart = BLOCK_SIZE * yPix
-            xDiff = pixPath[i + 1][0] - xPix
-            yDiff = pixPath[i + 1][1] - yPix
-            # Calculate all in-between values for real path
-            newRealPath = [
-                (xRealStart + n * xDiff, yRealStart + n * yDiff)
-                for n in range(0, BLOCK_SIZE)
-            ]
-            realPath.extend(newRealPath)
-
-        lastXPix = pixPath[len(pixPath) - 1][0]
-        lastYPix = pixPath[len(pixPath) - 1][1]
-        lastXRealStart = BLOCK_SIZE * lastXPix
-        lastYRealStart = BLOCK_SIZE * lastYPix
-        lastRealPos = (lastXRealStart, lastYRealStart)
-        realPath.append(lastRealPos)
-
-        return realPath
+        return NpcPath(pixPath)
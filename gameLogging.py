@@ -0,0 +1,55 @@
+"""gameLogging
+    * Configures logging of the whole game
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from gameConstants import *
+
+
+def setup_logging(filename=LOG_FILE, level=logging.DEBUG):
+    """setup logging
+    * Log records are only put into a queue, a background thread writes them to a rotating log file
+    * So writing the log file never blocks the game loop
+    * Log of the previous run is kept as first backup file, the listener is stopped (queue written) at exit
+
+    Args:
+        filename (string, optional): Path of the log file. Defaults to LOG_FILE.
+        level (int, optional): Level of the root logger. Defaults to logging.DEBUG.
+
+    Return:
+        listener (logging.handlers.QueueListener): Started background writer
+
+    Test:
+        * Records logged right before exit are in the log file
+        * Log file never grows beyond LOG_MAX_BYTES, older records are in backup files
+    """
+    fileHandler = RotatingFileHandler(
+        filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    if os.path.exists(filename) and os.path.getsize(filename) > 0:
+        fileHandler.doRollover()
+    fileHandler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s %(name)-12s %(levelname)-8s %(message)s",
+            datefmt="%m-%d %H:%M",
+        )
+    )
+
+    logQueue = queue.SimpleQueue()
+    listener = QueueListener(logQueue, fileHandler)
+    rootLogger = logging.getLogger()
+    for handler in rootLogger.handlers[:]:
+        rootLogger.removeHandler(handler)
+    rootLogger.addHandler(QueueHandler(logQueue))
+    rootLogger.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
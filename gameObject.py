@@ -6,25 +6,25 @@
         date: 06.06.2021
         version: 0.0.1
 """
-import logging
 import pygame
 from gameConstants import *
 
 
-class GameObject(pygame.sprite.Sprite):
+class GameObject(pygame.sprite.DirtySprite):
     """GameObject class
     * All stationary objects within game are objects of this class
     * Holds generic real rect, rect, image and layer attributes for right blitting
+    * Is only drawn again if dirty or overlapped by a dirty sprite
 
     Args:
-        pygame.sprite.Sprite (class): Parent class of GameObject (inherits from)
+        pygame.sprite.DirtySprite (class): Parent class of GameObject (inherits from)
 
     Public methods:
         def moveLayer(self, offset)
     """
 
     def __init__(self, surf, realPos):
-        pygame.sprite.Sprite.__init__(self)  # call Sprite initializer
+        pygame.sprite.DirtySprite.__init__(self)  # call DirtySprite initializer
         self.image = surf
         # Create 'real' rect for collision detect in 2.5D space
         self.realRect = pygame.Rect(realPos, (BLOCK_SIZE, BLOCK_SIZE))
@@ -45,14 +45,33 @@ class AnimatedGameObject(GameObject):
         GameObject (class): Parent class of AnimatedGameObject (inherits from)
 
     Public methods:
+        def reset(self)
         def update(self, _)
     """
 
     def __init__(self, anim, realPos):
-        self.subFrameCounter = 0
-        self.imageCounter = 0
         self.anim = anim
         GameObject.__init__(self, anim[0], realPos)  # call GameObject initializer
+        self.reset()
+
+    def reset(self):
+        """reset
+        * Restarts the animation from the first image
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * imageCounter and subFrameCounter are 0 after reset
+            * self.image is the first image of the animation after reset
+        """
+        self.subFrameCounter = 0
+        self.imageCounter = 0
+        self.image = self.anim[0]
+        self.dirty = 1
 
     def update(self, _):
         """update
@@ -68,7 +87,6 @@ class AnimatedGameObject(GameObject):
             * Check if imageCounter updates every ANIMATION_REFRESH time period
             * Check if self.image surface updates every ANIMATION_REFRESH time period
         """
-        logging.info("Updating animated game objects...")
         # Animate Object
         if self.subFrameCounter == ANIMATION_REFRESH - 1:
             # Increment ImageCounter
@@ -79,9 +97,9 @@ class AnimatedGameObject(GameObject):
 
             # Set new Image
             self.image = self.anim[self.imageCounter]
+            self.dirty = 1
 
             # Reset SubFrameCounter
             self.subFrameCounter = 0
         else:
             self.subFrameCounter += 1
-        logging.info("Updating animated game objects was successful")
@@ -9,10 +9,16 @@
 """
 import logging
 import pygame
-from pygame.font import SysFont
 import os
 from game import Game
 from gameLoader import GameLoader
+from levelPrefetcher import LevelPrefetcher
+from audioManager import audioManager
+from textCache import textCache
+from hudWidget import LevelWidget, ButtonWidget, CounterWidget
+from dirtyRectCoalescer import DirtyRectCoalescer
+from frameProfiler import FrameProfiler
+from perfOverlay import PerfOverlay
 from loadsources import *
 from gameConstants import *
 
@@ -23,8 +29,10 @@ class GameView:
     * Loades game stats from save file if newGame bool is False
     * Creates game object for current level
     * Handles the user input during game
-    * Updates and blits the game in every time step
-    * Updates the bars after a change
+    * Simulates the game in fixed ticks and draws it as often as the display allows
+    * Updates only the changed widgets of the bars after a change
+    * Prepares the next level in background while the current one is played
+    * Shows a performance overlay with timings of the game loop on F3
 
     Public Methods:
         * def game_loop(self)
@@ -42,9 +50,11 @@ class GameView:
             self.gameStats = {"currentLvl": 1, "maskCount": 0, "deathCount": 0}
         # Create game object
         self.game = Game(self.gameLoader, self.gameStats)
+        self.levelPrefetcher = LevelPrefetcher(self.gameLoader)
         self.screen = pygame.display.get_surface()
         self.caption = pygame.display.set_caption("Sneaky Doctor")
         self.clock = pygame.time.Clock()
+        self.dirtyRects = DirtyRectCoalescer()
         self.homeIconImg, _ = load_image("icons/HomeIcon_Bar.png", scale=BUTTON_SIZE)
         self.speakerIconImg, _ = load_image("icons/speaker_bar.png", scale=BUTTON_SIZE)
         self.speakerMuteIconImg, _ = load_image(
@@ -53,7 +63,74 @@ class GameView:
         self.scullIconImg, _ = load_image("icons/skull_bar.png", scale=ICON_SIZE)
         self.maskIconImg, _ = load_image("icons/corona_mask.png", scale=ICON_SIZE)
         self.winGameAnim = load_animation("win_anim", scale=GAME_SIZE)
+        # Resolve fonts once, not on every redraw of the bars
+        self.levelFont = textCache.get_font("None", FONT_SIZE)
+        self.barFont = textCache.get_font("None", FONT_SIZE_BOTTOM_BAR)
+        self.perfFont = textCache.get_font("None", PERF_OVERLAY_FONT_SIZE)
+        # Performance overlay and its profiler, None while hidden (F3)
+        self.profiler = None
+        self.perfOverlay = None
         self.playingMusic = True
+        audioManager.preload()
+        self._createHudWidgets()
+
+    def _createHudWidgets(self):
+        """create hud widgets (private)
+        * Creates all widgets of the info bars and the clickable areas of the buttons
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Home and speaker rects are at the position of their icons
+            * Every widget is drawn by drawBars
+        """
+        # Top bar
+        self.levelWidget = LevelWidget(self.levelFont, self.gameStats["currentLvl"])
+        self.rectHome = pygame.Rect(
+            X_PADDING,
+            (BAR_HEIGHT - self.homeIconImg.get_height()) / 2,
+            BUTTON_SIZE[0],
+            BUTTON_SIZE[1],
+        )
+        self.homeWidget = ButtonWidget(
+            self.homeIconImg, (X_PADDING, (BAR_HEIGHT - self.rectHome.height) / 2)
+        )
+        self.rectSpeaker = pygame.Rect(
+            GAME_SIZE[0] - 2 * X_PADDING,
+            (BAR_HEIGHT - self.homeIconImg.get_height()) / 2,
+            BUTTON_SIZE[0],
+            BUTTON_SIZE[1],
+        )
+        self.speakerWidget = ButtonWidget(
+            self.speakerIconImg,
+            (
+                GAME_SIZE[0] - (self.rectSpeaker.width + X_PADDING),
+                (BAR_HEIGHT - self.rectSpeaker.height) / 2,
+            ),
+            self.playingMusic,
+            self.speakerMuteIconImg,
+        )
+        # Bottom bar
+        self.maskWidget = CounterWidget(
+            self.maskIconImg, self.barFont, self.gameStats["maskCount"]
+        )
+        self.deathWidget = CounterWidget(
+            self.scullIconImg,
+            self.barFont,
+            self.gameStats["deathCount"],
+            alignRight=True,
+        )
+        self.hudWidgets = [
+            self.levelWidget,
+            self.homeWidget,
+            self.speakerWidget,
+            self.maskWidget,
+            self.deathWidget,
+        ]
 
     def _winGame(self):
         """win game
@@ -74,7 +151,7 @@ class GameView:
         imageCounter = 0
         winAnimPos = (0, BAR_HEIGHT)
         while going:
-            self.clock.tick(int(round(FRAMERATE / ANIMATION_REFRESH)))
+            self.clock.tick(int(round(TICK_RATE / ANIMATION_REFRESH)))
 
             # Check game close conditions
             for event in pygame.event.get():
@@ -105,11 +182,155 @@ class GameView:
                 [(winAnimPos[0], winAnimPos[1], GAME_SIZE[0], GAME_SIZE[1])]
             )
 
+    def _prefetchNextLevel(self):
+        """prefetch next level (private)
+        * Starts preparing the level after the current one in background, if there is one
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Level after the current one is prefetched
+            * Nothing is prefetched while playing the last level
+        """
+        nextLvl = self.game.gameStats["currentLvl"] + 1
+        if check_level_exists(nextLvl):
+            self.levelPrefetcher.prefetch(nextLvl)
+
+    def _togglePerfOverlay(self):
+        """toggle perf overlay (private)
+        * Shows the performance overlay and starts timing input, game, bars and display updates
+        * Hides it again and removes all timing code, so a hidden overlay costs nothing
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Overlay is shown after first and hidden after second call
+            * Game area under a hidden overlay shows the game again
+        """
+        if self.perfOverlay is None:
+            self.profiler = FrameProfiler(PERF_SECTIONS)
+            self.profiler.instrument(self, "_handleEvents", "input")
+            self.profiler.instrument(self, "updateGameStats", "bars")
+            self.profiler.instrument(self, "drawBars", "bars")
+            self.profiler.instrument(self, "_updateDisplay", "display")
+            self.profiler.instrument(self.levelPrefetcher, "get_game", "load")
+            self.game.enable_profiling(self.profiler)
+            self.perfOverlay = PerfOverlay(self.profiler, self.perfFont)
+        else:
+            self.profiler.uninstrument_all()
+            # Game area under the overlay is drawn again with the next frame
+            self.game.allsprites.repaint_rect(
+                self.perfOverlay.rect.move(0, -BAR_HEIGHT)
+            )
+            self.profiler = None
+            self.perfOverlay = None
+
+    def _updateDisplay(self):
+        """update display (private)
+        * Updates the merged dirty areas of this frame on the display
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Changed areas are visible after the call
+            * Rects of the next frame start empty
+        """
+        pygame.display.update(self.dirtyRects.flush())
+
+    def _handleEvents(self):
+        """handle events (private)
+        * Handles all events since the last frame (keys, mouse, window closed)
+        * Keeps the pressed movement keys of the game up to date
+        * F3 shows or hides the performance overlay
+
+        Args:
+            None
+
+        Return:
+            going (bool): False if the game should be left
+            playingMusicChanged (bool): True if music was muted or unmuted
+
+        Test:
+            * Pressing and releasing d adds and removes K_d from pressedKeys
+            * Esc and click on home icon return going False
+        """
+        going = True
+        playingMusicChanged = False
+        # Input handling
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.mixer.music.stop()
+                going = False
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                pygame.mixer.music.stop()
+                going = False
+
+            if event.type == pygame.KEYUP and event.key in [
+                pygame.K_w,
+                pygame.K_a,
+                pygame.K_s,
+                pygame.K_d,
+                pygame.K_DOWN,
+                pygame.K_UP,
+                pygame.K_RIGHT,
+                pygame.K_LEFT,
+            ]:
+                self.game.pressedKeys.remove(event.key)
+
+            if event.type == pygame.KEYDOWN and event.key in [
+                pygame.K_w,
+                pygame.K_a,
+                pygame.K_s,
+                pygame.K_d,
+                pygame.K_DOWN,
+                pygame.K_UP,
+                pygame.K_RIGHT,
+                pygame.K_LEFT,
+            ]:
+                self.game.pressedKeys.append(event.key)
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = pygame.mouse.get_pos()
+
+                if self.rectHome.collidepoint(mouse_pos):
+                    pygame.mixer.music.stop()
+                    going = False
+
+                elif self.rectSpeaker.collidepoint(mouse_pos):
+
+                    if self.playingMusic:
+                        pygame.mixer.music.stop()
+
+                    else:
+                        pygame.mixer.music.play(-1)
+
+                    self.playingMusic = not self.playingMusic
+                    playingMusicChanged = True
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self._togglePerfOverlay()
+
+        return going, playingMusicChanged
+
     def game_loop(self):
         """game loop
             * Background sound is set here
             * Handles user input
-            * Game screen is drawn
+            * Game is simulated in ticks of TICK_DURATION, no matter how long a frame takes
+            * Game screen is drawn between the last two ticks
             * while loop handles the events
             * Changed areas on screen are updated
             * Saves game after exit
@@ -126,106 +347,84 @@ class GameView:
             * while loop interrupted when clicking on home icon
         """
 
-        # Setup display of game
+        # Setup display of game, game draws directly into the window
         self.drawBars()
-        self.screen.blit(self.game.screen, (0, BAR_HEIGHT))
+        self.game.attach(self.screen, (0, BAR_HEIGHT))
         pygame.display.flip()
         # Setup sound
-        load_sound("music.wav.mid")
+        audioManager.load_music("music.wav.mid")
         pygame.mixer.music.play(-1)
+        # Prepare next level in background
+        self._prefetchNextLevel()
 
         # Start game loop
         won = False
         going = True
+        # Time not simulated yet in milliseconds
+        accumulator = 0.0
         while going:
-            self.clock.tick(FRAMERATE)
+            accumulator = accumulator + self.clock.tick(FRAMERATE)
 
-            playingMusicChanged = False
-            # Input handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.mixer.music.stop()
-                    going = False
-
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    pygame.mixer.music.stop()
-                    going = False
+            going, playingMusicChanged = self._handleEvents()
 
-                if event.type == pygame.KEYUP and event.key in [
-                    pygame.K_w,
-                    pygame.K_a,
-                    pygame.K_s,
-                    pygame.K_d,
-                    pygame.K_DOWN,
-                    pygame.K_UP,
-                    pygame.K_RIGHT,
-                    pygame.K_LEFT,
-                ]:
-                    self.game.pressedKeys.remove(event.key)
-
-                if event.type == pygame.KEYDOWN and event.key in [
-                    pygame.K_w,
-                    pygame.K_a,
-                    pygame.K_s,
-                    pygame.K_d,
-                    pygame.K_DOWN,
-                    pygame.K_UP,
-                    pygame.K_RIGHT,
-                    pygame.K_LEFT,
-                ]:
-                    self.game.pressedKeys.append(event.key)
+            # Simulate all ticks that passed, drop the oldest ones after a stall
+            accumulator = min(accumulator, MAX_TICKS_PER_FRAME * TICK_DURATION)
+            while going and accumulator >= TICK_DURATION:
+                accumulator = accumulator - TICK_DURATION
+                self.game.tick()
 
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
-
-                    if self.rectHome.collidepoint(mouse_pos):
-                        pygame.mixer.music.stop()
+                # Restart level if player died
+                if self.game.checkDeath():
+                    newGameStats = self.game.gameStats.copy()
+                    newGameStats["deathCount"] = newGameStats["deathCount"] + 1
+                    self.game.reset(newGameStats)
+                    pygame.display.flip()
+                # Load new level if win
+                elif self.game.checkWin():
+                    newGameStats = self.game.gameStats.copy()
+                    newGameStats["currentLvl"] = newGameStats["currentLvl"] + 1
+                    if not check_level_exists(newGameStats["currentLvl"]):
+                        self._winGame()
                         going = False
-
-                    elif self.rectSpeaker.collidepoint(mouse_pos):
-
-                        if self.playingMusic:
-                            pygame.mixer.music.stop()
-
-                        else:
-                            pygame.mixer.music.play(-1)
-
-                        self.playingMusic = not self.playingMusic
-                        playingMusicChanged = True
-
-            # Update the game
-            gameDirtyAreas = self.game.update_game()
-            screenDirtyAreas = [x.move(0, BAR_HEIGHT) for x in gameDirtyAreas]
-            self.screen.blit(self.game.screen, (0, BAR_HEIGHT))
+                        won = True
+                    else:
+                        self.game = self.levelPrefetcher.get_game(
+                            newGameStats, self.game.pressedKeys
+                        )
+                        logging.info("Asset cache: " + str(assetRegistry.stats()))
+                        self.game.attach(self.screen, (0, BAR_HEIGHT))
+                        if self.profiler is not None:
+                            self.game.enable_profiling(self.profiler)
+                        pygame.display.flip()
+                        self._prefetchNextLevel()
+            if not going:
+                break
+
+            # Draw the game between the last two ticks, below the overlay if shown
+            if self.perfOverlay is not None:
+                self.game.allsprites.repaint_rect(
+                    self.perfOverlay.rect.move(0, -BAR_HEIGHT)
+                )
+            alpha = accumulator / TICK_DURATION
+            self.dirtyRects.add(self.game.draw(alpha), (0, BAR_HEIGHT))
             # Update the information bars
-            barsDirtyAreas = self.updateGameStats(playingMusicChanged)
-            screenDirtyAreas.extend(barsDirtyAreas)
-
-            # Update the display
-            pygame.display.update(screenDirtyAreas)
-
-            # Restart level if player died
-            if self.game.checkDeath():
-                newGameStats = self.game.gameStats.copy()
-                newGameStats["deathCount"] = newGameStats["deathCount"] + 1
-                self.game = Game(self.gameLoader, newGameStats, self.game.pressedKeys)
-                self.screen.blit(self.game.screen, (0, BAR_HEIGHT))
-                pygame.display.flip()
-            # Load new level if win
-            elif self.game.checkWin():
-                newGameStats = self.game.gameStats.copy()
-                newGameStats["currentLvl"] = newGameStats["currentLvl"] + 1
-                if not check_level_exists(newGameStats["currentLvl"]):
-                    self._winGame()
-                    going = False
-                    won = True
-                else:
-                    self.game = Game(
-                        self.gameLoader, newGameStats, self.game.pressedKeys
-                    )
-                    self.screen.blit(self.game.screen, (0, BAR_HEIGHT))
-                    pygame.display.flip()
-
+            self.dirtyRects.add(self.updateGameStats(playingMusicChanged))
+            if self.perfOverlay is not None:
+                self.dirtyRects.add(
+                    [
+                        self.perfOverlay.draw(
+                            self.screen, self.clock, self.game.blitCount
+                        )
+                    ]
+                )
+
+            # Update the display with merged dirty areas
+            self._updateDisplay()
+            if self.profiler is not None:
+                self.profiler.end_frame()
+
+        self.levelPrefetcher.shutdown()
+        logging.info("Dirty rects per frame: " + str(self.dirtyRects.stats()))
         if won:
             delete_game_save()
         else:
@@ -233,7 +432,8 @@ class GameView:
 
     def updateGameStats(self, playingMusicChanged=False):
         """update game stats
-            * Local gameStats and info bars are updated if game stats changed
+            * Local gameStats are updated if game stats changed
+            * Only the widgets of the info bars with changed values are drawn again
 
         Args:
             playingMusicChanged (bool, optional): Determines whether playingMusic icon should be updated
@@ -243,36 +443,31 @@ class GameView:
 
         Test:
             * Values in Top and Bottom bars drawn with updated game stats
-            * Only the changed areas within bars are updated not the full area of both bars
+            * Collecting a mask only returns the area of the mask counter
         """
 
         if self.gameStats != self.game.gameStats:
-            # If gameStats changed, update them
             self.gameStats = self.game.gameStats.copy()
-            # Redraw info bars
-            self.drawBars()
-            # Return new dirty areas from bars
-            return [
-                pygame.Rect(0, 0, GAME_SIZE[0], BAR_HEIGHT),
-                pygame.Rect(0, BAR_HEIGHT + GAME_SIZE[1], GAME_SIZE[0], BAR_HEIGHT),
-            ]
-
-        elif playingMusicChanged:
-            # If music player changed, update bars
-            self.drawBars()
-            # Return new dirty area from top bar
-            return [pygame.Rect(0, 0, GAME_SIZE[0], BAR_HEIGHT)]
-
-        else:
-            # If there are no changes, return no new dirty areas
-            return []
+            self.levelWidget.set_value(self.gameStats["currentLvl"])
+            self.maskWidget.set_value(self.gameStats["maskCount"])
+            self.deathWidget.set_value(self.gameStats["deathCount"])
+        if playingMusicChanged:
+            self.speakerWidget.set_value(self.playingMusic)
+
+        # Draw changed widgets and return their areas
+        dirtyAreas = []
+        for widget in self.hudWidgets:
+            dirtyRect = widget.draw(self.screen)
+            if dirtyRect is not None:
+                dirtyAreas.append(dirtyRect)
+        return dirtyAreas
 
     # TODO: Size of icon/Schrift abhängig von BarHeight
     def drawBars(self):
         """Draw bars
         * Top and bottom bars are drawn
         * At beginning of this function both bars are resetted
-        * All icons and text fields within the bars are drawn here through blit function
+        * All widgets (icons and text fields) within the bars are drawn with the current values
 
         Args:
             None
@@ -291,114 +486,12 @@ class GameView:
             BAR_COLOR, (0, BAR_HEIGHT + GAME_SIZE[1], GAME_SIZE[0], BAR_HEIGHT)
         )
 
-        # Level information
-        levelText = pygame.font.SysFont("None", FONT_SIZE)
-        textImg = levelText.render(
-            f"Level: {self.gameStats['currentLvl']}/{NUM_LEVELS}",
-            False,
-            (231, 231, 231),
-        )
-        rect = textImg.get_rect()
-        pygame.draw.rect(textImg, BAR_COLOR, rect, 1)
-        self.screen.blit(
-            textImg,
-            (
-                (GAME_SIZE[0] - rect.width) / 2,
-                (BAR_HEIGHT - rect.height - levelText.get_descent()) / 2,
-            ),
-        )
-
-        # Home icon
-        self.rectHome = pygame.Rect(
-            X_PADDING,
-            (BAR_HEIGHT - self.homeIconImg.get_height()) / 2,
-            BUTTON_SIZE[0],
-            BUTTON_SIZE[1],
-        )
-        self.screen.blit(
-            self.homeIconImg, (X_PADDING, (BAR_HEIGHT - self.rectHome.height) / 2)
-        )
-
-        # Speaker Icon
-        self.rectSpeaker = pygame.Rect(
-            GAME_SIZE[0] - 2 * X_PADDING,
-            (BAR_HEIGHT - self.homeIconImg.get_height()) / 2,
-            BUTTON_SIZE[0],
-            BUTTON_SIZE[1],
-        )
-
-        if self.playingMusic:
-            self.screen.blit(
-                self.speakerIconImg,
-                (
-                    GAME_SIZE[0] - (self.rectSpeaker.width + X_PADDING),
-                    (BAR_HEIGHT - self.rectSpeaker.height) / 2,
-                ),
-            )
-
-        else:
-            self.screen.blit(
-                self.speakerMuteIconImg,
-                (
-                    GAME_SIZE[0] - (self.rectSpeaker.width + X_PADDING),
-                    (BAR_HEIGHT - self.rectSpeaker.height) / 2,
-                ),
-            )
-
-        # Mask Icon
-        rectMask = self.maskIconImg.get_rect()
-        maskPos = (
-            X_PADDING,
-            BAR_HEIGHT + GAME_SIZE[1] + round((BAR_HEIGHT - rectMask.height) / 2),
-        )
-        self.screen.blit(
-            self.maskIconImg,
-            maskPos,
-        )
-
-        # Mask Text
-        numMaskText = pygame.font.SysFont("None", FONT_SIZE_BOTTOM_BAR)
-        textImgMask = numMaskText.render(
-            f": {self.gameStats['maskCount']}", False, (231, 231, 231)
-        )
-        rectNumMask = textImgMask.get_rect()
-        pygame.draw.rect(textImgMask, BAR_COLOR, rectNumMask, 1)
-        self.screen.blit(
-            textImgMask,
-            (
-                maskPos[0] + rectMask.width + 5,
-                BAR_HEIGHT
-                + GAME_SIZE[1]
-                + (BAR_HEIGHT - rectNumMask.height - numMaskText.get_descent()) / 2,
-            ),
-        )
-
-        # Death Text
-        numDeathText = pygame.font.SysFont("None", FONT_SIZE_BOTTOM_BAR)
-        textImgDeath = numDeathText.render(
-            f": {self.gameStats['deathCount']}", False, (231, 231, 231)
-        )
-        rectNumDeath = textImgDeath.get_rect()
-        pygame.draw.rect(textImgDeath, BAR_COLOR, rectNumDeath, 1)
-        numDeathPos = (
-            GAME_SIZE[0] - (rectNumDeath.x + rectNumDeath.width + X_PADDING),
-            BAR_HEIGHT
-            + GAME_SIZE[1]
-            + (BAR_HEIGHT - rectNumDeath.height - numDeathText.get_descent()) / 2,
-        )
-        self.screen.blit(
-            textImgDeath,
-            numDeathPos,
-        )
-
-        # Scull Icon
-        rectScull = self.scullIconImg.get_rect()
-        self.screen.blit(
-            self.scullIconImg,
-            (
-                numDeathPos[0] - rectScull.width - 5,
-                BAR_HEIGHT + GAME_SIZE[1] + (BAR_HEIGHT - rectScull.height) / 2,
-            ),
-        )
+        self.levelWidget.set_value(self.gameStats["currentLvl"])
+        self.maskWidget.set_value(self.gameStats["maskCount"])
+        self.deathWidget.set_value(self.gameStats["deathCount"])
+        self.speakerWidget.set_value(self.playingMusic)
+        for widget in self.hudWidgets:
+            widget.invalidate()
+            widget.draw(self.screen)
 
         logging.info("Drawing info bars was successful")
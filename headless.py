@@ -0,0 +1,127 @@
+"""headless
+    * Simulates the game without window and sound as fast as the CPU allows, e.g. on servers
+    * Uses the SDL dummy drivers, no menu and no GameView (info bars, display updates) are involved
+    * Run: python headless.py [--level N] [--ticks N] [--script FILE] [--seed N] [--no-draw]
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import os
+
+# Dummy drivers have to be set before pygame is initialized
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import argparse
+import random
+import time
+import pygame
+from gameLoader import GameLoader
+from game import Game
+from inputScript import load_input_script, random_input_script
+from loadsources import check_level_exists
+from gameConstants import *
+
+
+def run_headless(gameLoader, levelNum, ticks, inputScript, draw=True):
+    """run headless
+    * Plays from levelNum on for a number of ticks with scripted input
+    * Restarts the level on death and continues with the next level on win, like GameView
+    * Stops early if the last level is won
+
+    Args:
+        gameLoader (GameLoader): Loader of the levels
+        levelNum (int): Number of the level to start with
+        ticks (int): Number of ticks to simulate
+        inputScript (InputScript): Pressed keys by tick
+        draw (bool, optional): Draw every tick onto the (offscreen) game Surface. Defaults to True.
+
+    Return:
+        (dict): Simulated ticks, seconds spent simulating and loading levels, ticks per second, blits per tick, game stats
+
+    Test:
+        * Same script and seed result in same game stats
+        * Running into the exit of the last level stops the run
+    """
+    pressedKeys = []
+    gameStats = {"currentLvl": levelNum, "maskCount": 0, "deathCount": 0}
+    loadStart = time.perf_counter()
+    game = Game(gameLoader, gameStats, pressedKeys)
+    firstLoadTime = time.perf_counter() - loadStart
+    # Time of level loads during the simulation
+    reloadTime = 0.0
+    simulatedTicks = 0
+    blits = 0
+    won = False
+
+    start = time.perf_counter()
+    for tick in range(0, ticks):
+        inputScript.apply(tick, pressedKeys)
+        if draw:
+            game.update_game()
+            blits = blits + game.blitCount
+        else:
+            game.tick()
+        simulatedTicks = simulatedTicks + 1
+
+        # Restart level if player died
+        if game.checkDeath():
+            newGameStats = game.gameStats.copy()
+            newGameStats["deathCount"] = newGameStats["deathCount"] + 1
+            game.reset(newGameStats)
+        # Load new level if win
+        elif game.checkWin():
+            newGameStats = game.gameStats.copy()
+            newGameStats["currentLvl"] = newGameStats["currentLvl"] + 1
+            if not check_level_exists(newGameStats["currentLvl"]):
+                won = True
+                break
+            loadStart = time.perf_counter()
+            game = Game(gameLoader, newGameStats, pressedKeys)
+            reloadTime = reloadTime + time.perf_counter() - loadStart
+    seconds = time.perf_counter() - start
+
+    # Level loads are reported on their own, not as simulation time
+    simulationTime = max(seconds - reloadTime, 1e-9)
+    return {
+        "ticks": simulatedTicks,
+        "simulationSeconds": round(simulationTime, 3),
+        "loadSeconds": round(firstLoadTime + reloadTime, 3),
+        "ticksPerSecond": round(simulatedTicks / simulationTime, 1),
+        "blitsPerTick": round(blits / max(simulatedTicks, 1), 1),
+        "won": won,
+        "gameStats": game.gameStats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Sneaky Doctor headless")
+    parser.add_argument("--level", type=int, default=1, help="level to start with")
+    parser.add_argument("--ticks", type=int, default=10000, help="ticks to simulate")
+    parser.add_argument("--script", help="input script (json), random keys if unset")
+    parser.add_argument("--seed", type=int, default=0, help="seed of keys and skins")
+    parser.add_argument(
+        "--no-draw", action="store_true", help="simulate only, skip Game.draw"
+    )
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    # Enemy skins are chosen randomly
+    random.seed(args.seed)
+    if args.script:
+        inputScript = load_input_script(args.script)
+    else:
+        inputScript = random_input_script(args.seed, args.ticks)
+
+    result = run_headless(
+        GameLoader(), args.level, args.ticks, inputScript, not args.no_draw
+    )
+    for name, value in result.items():
+        print(name + ": " + str(value))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""hudWidget
+    * Hold the HudWidget, LevelWidget, ButtonWidget and CounterWidget classes
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+from textCache import textCache
+from gameConstants import *
+
+
+class HudWidget:
+    """HudWidget class
+    * Base class of all elements within the info bars
+    * Holds a value and is only drawn again after the value changed
+    * Remembers the area it covers, so only that area is cleared and updated
+
+    Public methods:
+        def set_value(self, value)
+        def invalidate(self)
+        def draw(self, screen)
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self.dirty = True
+        # Area covered on screen by the last draw, None if not drawn yet
+        self.drawnRect = None
+
+    def set_value(self, value):
+        """set value
+        * Changes the displayed value, widget is only drawn again if the value is different
+
+        Args:
+            value: New value to display
+
+        Return:
+            None
+
+        Test:
+            * Setting a different value makes the widget dirty
+            * Setting the same value keeps the widget clean
+        """
+        if value != self.value:
+            self.value = value
+            self.dirty = True
+
+    def invalidate(self):
+        """invalidate
+        * Forces drawing the widget again, e.g. after its bar was cleared
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Widget is drawn on next draw call
+            * Previously covered area is not cleared on next draw call
+        """
+        self.dirty = True
+        self.drawnRect = None
+
+    def draw(self, screen):
+        """draw
+        * Clears the previously covered area and draws the widget if it is dirty
+
+        Args:
+            screen (pygame.Surface): Surface of the whole window
+
+        Return:
+            dirtyRect (pygame.Rect): Changed area (old and new covered area), None if nothing was drawn
+
+        Test:
+            * Clean widget returns None and does not change screen
+            * Returned rect contains all changed pixels
+        """
+        if not self.dirty:
+            return None
+        dirtyRect = self.drawnRect
+        if self.drawnRect is not None:
+            screen.fill(BAR_COLOR, self.drawnRect)
+        self.drawnRect = self._draw_content(screen)
+        self.dirty = False
+        if dirtyRect is None:
+            return self.drawnRect
+        return dirtyRect.union(self.drawnRect)
+
+    def _draw_content(self, screen):
+        """draw content (private)
+        * Blits the widget according to its value, implemented by every widget
+
+        Args:
+            screen (pygame.Surface): Surface of the whole window
+
+        Return:
+            (pygame.Rect): Area covered on screen
+        """
+        raise NotImplementedError
+
+
+class LevelWidget(HudWidget):
+    """LevelWidget class
+    * Level information centered in top bar
+
+    Public methods:
+        None
+    """
+
+    def __init__(self, font, levelNum):
+        self.font = font
+        HudWidget.__init__(self, levelNum)
+
+    def _draw_content(self, screen):
+        """draw content (private)
+        * Blits the level text centered in the top bar
+
+        Args:
+            screen (pygame.Surface): Surface of the whole window
+
+        Return:
+            (pygame.Rect): Area covered by the text
+
+        Test:
+            * Text is centered horizontally in the top bar
+            * Text shows the current and the last level number
+        """
+        textImg = textCache.render(
+            self.font, f"Level: {self.value}/{NUM_LEVELS}", TEXT_COLOR, BAR_COLOR
+        )
+        rect = textImg.get_rect()
+        return screen.blit(
+            textImg,
+            (
+                (GAME_SIZE[0] - rect.width) / 2,
+                (BAR_HEIGHT - rect.height - self.font.get_descent()) / 2,
+            ),
+        )
+
+
+class ButtonWidget(HudWidget):
+    """ButtonWidget class
+    * Icon within a bar, value True shows image, False shows inactiveImage
+
+    Public methods:
+        None
+    """
+
+    def __init__(self, image, pos, active=True, inactiveImage=None):
+        self.image = image
+        self.inactiveImage = inactiveImage
+        self.pos = pos
+        HudWidget.__init__(self, active)
+
+    def _draw_content(self, screen):
+        """draw content (private)
+        * Blits image if active, inactiveImage if inactive (image if there is none)
+
+        Args:
+            screen (pygame.Surface): Surface of the whole window
+
+        Return:
+            (pygame.Rect): Area covered by the icon
+
+        Test:
+            * Inactive speaker button shows the muted icon
+            * Button without inactiveImage always shows image
+        """
+        if self.value or self.inactiveImage is None:
+            return screen.blit(self.image, self.pos)
+        return screen.blit(self.inactiveImage, self.pos)
+
+
+class CounterWidget(HudWidget):
+    """CounterWidget class
+    * Icon and number within the bottom bar
+    * Left aligned counters start with the icon, right aligned ones end with the number
+
+    Public methods:
+        None
+    """
+
+    def __init__(self, icon, font, count, alignRight=False):
+        self.icon = icon
+        self.font = font
+        self.alignRight = alignRight
+        HudWidget.__init__(self, count)
+
+    def _draw_content(self, screen):
+        """draw content (private)
+        * Blits icon and count vertically centered in the bottom bar, on the left or right side
+
+        Args:
+            screen (pygame.Surface): Surface of the whole window
+
+        Return:
+            (pygame.Rect): Area covered by icon and text
+
+        Test:
+            * Right aligned counter ends X_PADDING before the right window edge
+            * Icon and text do not overlap for multi digit counts
+        """
+        barTop = BAR_HEIGHT + GAME_SIZE[1]
+        textImg = textCache.render(self.font, f": {self.value}", TEXT_COLOR, BAR_COLOR)
+        rectText = textImg.get_rect()
+        rectIcon = self.icon.get_rect()
+        textY = barTop + (BAR_HEIGHT - rectText.height - self.font.get_descent()) / 2
+        iconY = barTop + (BAR_HEIGHT - rectIcon.height) / 2
+
+        if self.alignRight:
+            textX = GAME_SIZE[0] - (rectText.width + X_PADDING)
+            iconX = textX - rectIcon.width - 5
+        else:
+            iconX = X_PADDING
+            textX = iconX + rectIcon.width + 5
+
+        drawnRect = screen.blit(textImg, (textX, textY))
+        return drawnRect.union(screen.blit(self.icon, (iconX, iconY)))
@@ -0,0 +1,125 @@
+"""inputScript
+    * Holds the InputScript class and functions to load or create input scripts
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import logging
+import json
+import random
+import pygame
+
+
+class InputScript:
+    """InputScript class
+    * Holds the keys pressed during a simulation run, stored only at the ticks they change
+    * Replays them into the pressedKeys list of a Game, so runs without keyboard are repeatable
+
+    Public Methods:
+    * def apply(self, tick, pressedKeys)
+    * def save(self, filename)
+    """
+
+    def __init__(self, changes=None):
+        # Pressed keys by tick from which on they are held
+        self.changes = {} if changes is None else changes
+
+    def apply(self, tick, pressedKeys):
+        """apply
+        * Replaces the pressed keys if they change at tick
+
+        Args:
+            tick (int): Number of the tick about to be simulated
+            pressedKeys (list): Pressed keys of the Game, changed in place
+
+        Return:
+            None
+
+        Test:
+            * pressedKeys holds the keys of the last change at or before tick
+            * pressedKeys is unchanged at ticks without change
+        """
+        if tick in self.changes:
+            pressedKeys[:] = self.changes[tick]
+
+    def save(self, filename):
+        """save
+        * Writes the script as json, keys are stored by name (e.g. "w", "left")
+
+        Args:
+            filename (string): Path of the script file
+
+        Return:
+            None
+
+        Test:
+            * load_input_script of the saved file returns the same changes
+            * Arrow keys are saved by name
+        """
+        changes = [
+            [tick, [pygame.key.name(key) for key in keys]]
+            for tick, keys in sorted(self.changes.items())
+        ]
+        with open(filename, "w") as scriptFile:
+            scriptFile.write(json.dumps(changes))
+
+
+def load_input_script(filename):
+    """load input script
+    * Loads a script written by InputScript.save or by hand
+    * Format: json list of [tick, [key names]], e.g. [[0, ["d"]], [30, ["s", "a"]]]
+
+    Args:
+        filename (string): Path of the script file
+
+    Raises:
+        SystemExit: Script can't be loaded
+
+    Return:
+        inputScript (InputScript): Loaded script
+
+    Test:
+        * Script of all movement keys is loaded
+        * Unknown key name results in exception
+    """
+    logging.info("Loading input script " + filename + "...")
+    try:
+        with open(filename, "r") as scriptFile:
+            changes = json.loads(scriptFile.read())
+        inputScript = InputScript(
+            {
+                int(tick): [pygame.key.key_code(name) for name in names]
+                for tick, names in changes
+            }
+        )
+    except (OSError, ValueError, TypeError) as message:
+        logging.error("Cannot load input script: " + filename)
+        raise SystemExit(message)
+    logging.info("Loading input script was successful")
+    return inputScript
+
+
+def random_input_script(seed, ticks, interval=15):
+    """random input script
+    * Creates a script that holds up to two random movement keys, changing every interval ticks
+
+    Args:
+        seed (int): Seed of the random keys, same seed results in same script
+        ticks (int): Number of ticks the script covers
+        interval (int, optional): Ticks between key changes. Defaults to 15.
+
+    Return:
+        inputScript (InputScript): Created script
+
+    Test:
+        * Same seed results in same changes
+        * No key is pressed twice at once
+    """
+    rand = random.Random(seed)
+    moveKeys = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d]
+    changes = {}
+    for tick in range(0, ticks, interval):
+        changes[tick] = rand.sample(moveKeys, rand.randint(0, 2))
+    return InputScript(changes)
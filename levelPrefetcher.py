@@ -0,0 +1,113 @@
+"""levelPrefetcher
+    * Holds the LevelPrefetcher class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from game import Game
+
+
+class LevelPrefetcher:
+    """LevelPrefetcher class
+    * Creates the Game object of the next level in a worker thread while the current level is played
+    * Hands out the prepared Game on level change, so the change only swaps objects
+    * Counts how often the prepared Game was ready in time
+
+    Public Methods:
+    * def prefetch(self, levelNum)
+    * def get_game(self, gameStats, pressedKeys)
+    * def shutdown(self)
+    """
+
+    def __init__(self, gameLoader):
+        self.gameLoader = gameLoader
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.levelNum = None
+        self.future = None
+        # Instrumentation counters
+        self.readyCount = 0
+        self.notReadyCount = 0
+
+    def prefetch(self, levelNum):
+        """prefetch
+        * Starts creating the Game object of a level in the worker thread
+
+        Args:
+            levelNum (int): Number of the level that is played next
+
+        Return:
+            None
+
+        Test:
+            * Game of levelNum is created without blocking the game loop
+            * Prefetching another level replaces the previous one
+        """
+        logging.info("Prefetching level " + str(levelNum) + "...")
+        if self.future is not None:
+            self.future.cancel()
+        self.levelNum = levelNum
+        # Game stats are replaced when the game is handed out
+        prefetchStats = {"currentLvl": levelNum, "maskCount": 0, "deathCount": 0}
+        self.future = self.executor.submit(Game, self.gameLoader, prefetchStats, [])
+
+    def get_game(self, gameStats, pressedKeys):
+        """get game
+        * Returns the prefetched Game object of the level in gameStats
+        * Waits for the worker if it is not finished yet, creates the Game directly if it was never prefetched
+
+        Args:
+            gameStats (dict): Game stats to start the level with
+            pressedKeys (list): Keys that are currently pressed
+
+        Return:
+            game (Game): Game object of the level in gameStats
+
+        Test:
+            * Returned game has the given game stats and pressed keys
+            * readyCount is increased if the worker finished before the call, notReadyCount if not
+        """
+        if self.future is not None and self.levelNum == gameStats["currentLvl"]:
+            if self.future.done():
+                self.readyCount = self.readyCount + 1
+            else:
+                self.notReadyCount = self.notReadyCount + 1
+            game = self.future.result()
+            game.gameStats = gameStats.copy()
+            game.pressedKeys = pressedKeys
+        else:
+            self.notReadyCount = self.notReadyCount + 1
+            game = Game(self.gameLoader, gameStats, pressedKeys)
+        self.levelNum = None
+        self.future = None
+
+        logging.info(
+            "Prefetched levels ready in time: "
+            + str(self.readyCount)
+            + ", not ready in time: "
+            + str(self.notReadyCount)
+        )
+        return game
+
+    def shutdown(self):
+        """shutdown
+        * Stops the worker thread, a running prefetch is finished but discarded
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Worker thread ends after the game loop ends
+            * Calling shutdown twice does not result in exception
+        """
+        if self.future is not None:
+            self.future.cancel()
+        self.future = None
+        self.levelNum = None
+        self.executor.shutdown(wait=False)
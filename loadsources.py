@@ -1,5 +1,6 @@
 """loadsources
     * Contains all load functions needed in project
+    * Holds the AssetRegistry class caching all loaded surfaces
 
     Attributes:
         authors: Benjamin Ader & Sujan Kanapathipillai
@@ -12,31 +13,175 @@ import json
 import pygame
 import random
 import time
+import threading
+from collections import OrderedDict
 from gameConstants import *
 
 
-def load_animation(folder, scale=None, colorkey=None):
-    """load animation
-        * images of an animation are loaded 
+class AssetRegistry:
+    """AssetRegistry class
+    * Memoizes loaded surfaces by (path, scale, colorkey), so every asset is read from disk only once
+    * Evicts the least recently used assets if the cached surfaces exceed the memory budget
+    * Counts cache hits and misses
+    * Can be used from the level prefetch thread
+
+    Public Methods:
+    * def get(self, path, scale, colorkey, loadFunc)
+    * def stats(self)
+    * def clear(self)
+    """
+
+    def __init__(self, memoryBudget=ASSET_CACHE_BUDGET):
+        self.memoryBudget = memoryBudget
+        # Cached assets with their size in bytes, least recently used first
+        self.assets = OrderedDict()
+        self.memoryUsed = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, path, scale, colorkey, loadFunc):
+        """get
+        * Returns the cached asset, loads it with loadFunc if it is not cached
 
         Args:
-            folder (string): Name of folder which contains images
+            path (string or tuple): Path of the image file or animation folder, tuple for variants of it
+            scale (tuple): The size of the asset, None if not scaled
+            colorkey (tuple): The color as rgb value, None if not used
+            loadFunc (function): Loads the asset, returns a pygame.Surface or list of pygame.Surfaces
+
+        Return:
+            asset (pygame.Surface or list): Cached asset, must not be changed by the caller
+
+        Test:
+            * Second call with same arguments does not call loadFunc and increases hits
+            * Assets exceeding the memory budget evict the least recently used ones
+        """
+        if scale is not None:
+            scale = tuple(scale)
+        key = (path, scale, colorkey)
+        with self.lock:
+            if key in self.assets:
+                self.hits = self.hits + 1
+                self.assets.move_to_end(key)
+                return self.assets[key][0]
+            self.misses = self.misses + 1
+
+        asset = loadFunc()
+        surfaces = asset if isinstance(asset, list) else [asset]
+        size = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces)
+
+        with self.lock:
+            if key not in self.assets:
+                self.assets[key] = (asset, size)
+                self.memoryUsed = self.memoryUsed + size
+            # Evict least recently used assets, but always keep the newest one
+            while self.memoryUsed > self.memoryBudget and len(self.assets) > 1:
+                _, (_, evictedSize) = self.assets.popitem(last=False)
+                self.memoryUsed = self.memoryUsed - evictedSize
+                self.evictions = self.evictions + 1
+        return asset
+
+    def stats(self):
+        """stats
+        * Returns cache statistics
+
+        Args:
+            None
+
+        Return:
+            (dict): hits, misses, evictions, number of cached assets and used memory in bytes
+
+        Test:
+            * Loading the same level twice only increases hits
+            * Values are 0 for a new registry
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "assets": len(self.assets),
+                "memoryUsed": self.memoryUsed,
+            }
+
+    def clear(self):
+        """clear
+        * Removes all cached assets, statistics are kept
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Next get call after clear loads the asset again
+            * memoryUsed is 0 after clear
+        """
+        with self.lock:
+            self.assets.clear()
+            self.memoryUsed = 0
+
+
+# Registry of all surfaces loaded by the load functions below
+assetRegistry = AssetRegistry()
+
+
+def _load_image_file(fullname, scale=None, colorkey=None):
+    """load image file (private)
+        * image is loaded from disk, scaled and converted
+
+        Args:
+            fullname (string): Path of the image file
+            scale (tuple, optional): The size of the image. Defaults to None.
+            colorkey (tuple, optional): The color as rgb value. Defaults to None.
+
+        Raises:
+            SystemExit: Image can't be loaded
+
+        Return:
+            image (pygame.Surface): Loaded image
+
+        Test:
+            * Returned image has the scale size that is passed in the function call
+            * Wrong file name results in exception
+    """
+    try:
+        image = pygame.image.load(fullname)
+    except pygame.error as message:
+        logging.error("Cannot load image: " + fullname)
+        raise SystemExit(message)
+    if scale is not None:
+        image = pygame.transform.scale(image, scale)
+    if colorkey is not None:
+        if colorkey == -1:
+            colorkey = image.get_at((0, 0))
+        image.set_colorkey(colorkey, pygame.RLEACCEL)
+    return image.convert_alpha()
+
+
+def _load_animation_frames(directory, scale=None, colorkey=None, flipped=False):
+    """load animation frames (private)
+        * all .png images of a folder are loaded from disk in order of their names
+
+        Args:
+            directory (string): Path of the folder which contains images
             scale (tuple, optional): The size of the animation. Defaults to None.
             colorkey (tuple, optional): The color as rgb value. Defaults to None.
+            flipped (bool, optional): Mirror the images horizontally. Defaults to False.
 
         Raises:
-            SystemExit: [description]
+            SystemExit: Image can't be loaded
 
         Return:
-            images (list): List of pygame.Surfaces is returned
-        
-        Test: 
-            * Checking number of images within folder and number of elements within returned list 
+            images (list): List of pygame.Surfaces
+
+        Test:
+            * Checking number of images within folder and number of elements within returned list
             * Wrong folder name should result in exception
     """
-    logging.info("Loading animation...")
-    directory = os.path.join(ASSETS_LOCATION, folder)
-
     images = []
     # Get every animation frame of list
     filesList = os.listdir(directory)
@@ -48,36 +193,63 @@ def load_animation(folder, scale=None, colorkey=None):
         if not filename.endswith(".png"):
             continue
         fullname = os.path.join(directory, filename)
+        image = _load_image_file(fullname, scale, colorkey)
+        if flipped:
+            image = pygame.transform.flip(image, True, False)
+        images.append(image)
 
-        try:
-            image = pygame.image.load(fullname)
-        except pygame.error as message:
-            logging.error("Cannot load image: " + filename)
-            raise SystemExit(message)
-        if scale is not None:
-            image = pygame.transform.scale(image, scale)
-        if colorkey is not None:
-            if colorkey == -1:
-                colorkey = image.get_at((0, 0))
-            image.set_colorkey(colorkey, RLEACCEL)
-        image = image.convert_alpha()
+    return images
 
-        images.append(image)
+
+def load_animation(folder, scale=None, colorkey=None, flipped=False):
+    """load animation
+        * images of an animation are loaded (from assetRegistry if loaded before)
+        * flipped images are created from freshly loaded ones, cached images are never read for it,
+          so a Game can be created in another thread while the cached images are drawn
+
+        Args:
+            folder (string): Name of folder which contains images
+            scale (tuple, optional): The size of the animation. Defaults to None.
+            colorkey (tuple, optional): The color as rgb value. Defaults to None.
+            flipped (bool, optional): Mirror the images horizontally. Defaults to False.
+
+        Raises:
+            SystemExit: Image can't be loaded
+
+        Return:
+            images (list): List of pygame.Surfaces is returned
+        
+        Test: 
+            * Checking number of images within folder and number of elements within returned list 
+            * Wrong folder name should result in exception
+    """
+    logging.info("Loading animation...")
+    directory = os.path.join(ASSETS_LOCATION, folder)
+    # Flipped animation is cached separately from the original one
+    registryPath = (directory, "flipped") if flipped else directory
+
+    images = assetRegistry.get(
+        registryPath,
+        scale,
+        colorkey,
+        lambda: _load_animation_frames(directory, scale, colorkey, flipped),
+    )
     logging.info("Loading animation was successful")
-    
-    return images
+
+    # Copy list, so the cached one is not changed by the caller
+    return list(images)
 
 
 def load_enemy_animations(scale=None, colorkey=None):
     """load enemy animations
-        * images of enemy animation is loaded 
+        * images of enemy animation is loaded (from assetRegistry if loaded before)
 
         Args:
             scale (tuple, optional): The size of the animation. Defaults to None.
             colorkey (tuple, optional): The color as rgb value. Defaults to None.
 
         Raises:
-            SystemExit: [description]
+            SystemExit: Image can't be loaded
 
         Return:
             animsDict (dictionary): Dictionary of pygame.Surfaces
@@ -90,38 +262,13 @@ def load_enemy_animations(scale=None, colorkey=None):
     # Get random enemy assets
     randEnemyNum = random.randint(1, ENEMY_SAMPLES_COUNT)
     randEnemyFolder = "npc" + str(randEnemyNum) + "_anim"
-    baseDirectory = os.path.join(ASSETS_LOCATION, randEnemyFolder)
 
     # Get all images for animation from all 4 angles
     animsDict = {"front": [], "right": [], "left": [], "back": []}
     for side in animsDict:
-        sideDirectory = os.path.join(baseDirectory, side)
-
-        # Get every animation frame of list
-        filesList = os.listdir(sideDirectory)
-        # Sort by name
-        filesList.sort()
-        # Load all animtion frames and add them to array
-        for file in filesList:
-            filename = os.fsdecode(file)
-            if not filename.endswith(".png"):
-                continue
-            fullname = os.path.join(sideDirectory, filename)
-
-            try:
-                image = pygame.image.load(fullname)
-            except pygame.error as message:
-                logging.error("Cannot load image: " + filename)
-                raise SystemExit(message)
-            if scale is not None:
-                image = pygame.transform.scale(image, scale)
-            if colorkey is not None:
-                if colorkey == -1:
-                    colorkey = image.get_at((0, 0))
-                image.set_colorkey(colorkey, RLEACCEL)
-            image = image.convert_alpha()
-
-            animsDict[side].append(image)
+        animsDict[side] = load_animation(
+            os.path.join(randEnemyFolder, side), scale=scale, colorkey=colorkey
+        )
     logging.info("Loading enemy animation was successful")
 
     return animsDict
@@ -129,7 +276,7 @@ def load_enemy_animations(scale=None, colorkey=None):
 
 def load_image(name, scale=None, colorkey=None):
     """load image 
-        * image is loaded 
+        * image is loaded (from assetRegistry if loaded before)
 
         Args:
             name (string): File name argument as string
@@ -137,7 +284,7 @@ def load_image(name, scale=None, colorkey=None):
             colorkey (tuple, optional): The color as rgb value. Defaults to None.
 
         Raises:
-            SystemExit: [description]
+            SystemExit: Image can't be loaded
 
         Returns:
             image (pygame.Surface): Loaded image is returned as pygame.Surface
@@ -149,18 +296,9 @@ def load_image(name, scale=None, colorkey=None):
     """
     logging.info("Loading image...")
     fullname = os.path.join(ASSETS_LOCATION, name)
-    try:
-        image = pygame.image.load(fullname)
-    except pygame.error as message:
-        logging.error("Cannot load image: " + name)
-        raise SystemExit(message)
-    if scale is not None:
-        image = pygame.transform.scale(image, scale)
-    if colorkey is not None:
-        if colorkey == -1:
-            colorkey = image.get_at((0, 0))
-        image.set_colorkey(colorkey, RLEACCEL)
-    image = image.convert_alpha()
+    image = assetRegistry.get(
+        fullname, scale, colorkey, lambda: _load_image_file(fullname, scale, colorkey)
+    )
     logging.info("Loading image was successful")
     return image, image.get_rect()
 
@@ -197,6 +335,9 @@ def load_collect_sound(filename):
         Args:
             filename (string): Filename of the sound that is loaded
 
+        Raises:
+            SystemExit: Sound can't be loaded
+
         Return:
             sound (Sound): Sound object is returned
         
@@ -210,6 +351,7 @@ def load_collect_sound(filename):
         sound = pygame.mixer.Sound(fullname)
     except pygame.error as message:
         logging.error("Cannot load sound: " + filename)
+        raise SystemExit(message)
     logging.info("Loading collect sound was successful")
     return sound
 
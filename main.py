@@ -10,19 +10,12 @@
 import logging
 from menu import Menu
 import pygame
+from gameLogging import setup_logging
 from gameConstants import *
 
 
-# Configure logger
-logging.basicConfig(
-    filename="game.log",
-    filemode="w",
-    level=logging.INFO,
-    force=True,
-    format="%(asctime)s %(name)-12s %(levelname)-8s %(message)s",
-    datefmt="%m-%d %H:%M",
-)
-logging.getLogger().setLevel(logging.DEBUG)
+# Configure logger, log file is written in background
+setup_logging()
 # Init game
 logging.info("Initializing pygame...")
 pygame.init()
@@ -0,0 +1,106 @@
+"""mergedWallGrid
+    * Holds the MergedWallGrid class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import pygame
+from wallGrid import WallGrid
+from gameConstants import *
+
+
+class MergedWallGrid(WallGrid):
+    """MergedWallGrid class
+    * WallGrid that merges contiguous wall tiles into as few rectangles as possible
+    * Collision queries test the merged rectangles first and only look up tiles of the hit ones
+    * Results are the same tile indices as WallGrid returns, so collision handling does not change
+
+    Public Methods:
+    * def collidelistall(self, rect)
+    * def collidelist(self, rect)
+    """
+
+    def __init__(self, realWallRects):
+        WallGrid.__init__(self, realWallRects)
+        self.mergedRects = self._merge_tiles()
+
+    def _merge_tiles(self):
+        """merge tiles (private)
+        * Covers all wall tiles with non overlapping rectangles
+        * Every rectangle is extended to the right as far as possible, then downwards as far as its full width allows
+
+        Args:
+            None
+
+        Return:
+            mergedRects (list): Real rects (top down view) that cover every wall tile exactly once
+
+        Test:
+            * Summed up area of mergedRects equals area of all wall rects
+            * Straight corridor of walls results in one rect
+        """
+        merged = [[False] * self.columns for _ in range(0, self.rows)]
+        mergedRects = []
+        for y in range(0, self.rows):
+            for x in range(0, self.columns):
+                if self.tiles[y][x] < 0 or merged[y][x]:
+                    continue
+                # Extend to the right
+                right = x
+                while (
+                    right + 1 < self.columns
+                    and self.tiles[y][right + 1] >= 0
+                    and not merged[y][right + 1]
+                ):
+                    right = right + 1
+                # Extend downwards while the whole width is free wall
+                bottom = y
+                while bottom + 1 < self.rows and all(
+                    self.tiles[bottom + 1][i] >= 0 and not merged[bottom + 1][i]
+                    for i in range(x, right + 1)
+                ):
+                    bottom = bottom + 1
+
+                for row in range(y, bottom + 1):
+                    for col in range(x, right + 1):
+                        merged[row][col] = True
+                mergedRects.append(
+                    pygame.Rect(
+                        x * BLOCK_SIZE,
+                        y * BLOCK_SIZE,
+                        (right - x + 1) * BLOCK_SIZE,
+                        (bottom - y + 1) * BLOCK_SIZE,
+                    )
+                )
+        return mergedRects
+
+    def collidelistall(self, rect):
+        """collidelistall
+        * Same result as rect.collidelistall(realWallRects), only looks up tiles of colliding merged rects
+
+        Args:
+            rect (pygame.Rect): Real rect (top down view) to test
+
+        Return:
+            collidedIdxs (list): Ascending indices of all colliding wall rects
+
+        Test:
+            * Result equals WallGrid.collidelistall for rects all over the map
+            * Rects partly out of the map do not result in exception
+        """
+        collidedIdxs = []
+        for mergedIdx in rect.collidelistall(self.mergedRects):
+            # Only tiles inside the overlapping area of both rects collide
+            clipRect = rect.clip(self.mergedRects[mergedIdx])
+            for y in range(
+                clipRect.top // BLOCK_SIZE, (clipRect.bottom - 1) // BLOCK_SIZE + 1
+            ):
+                row = self.tiles[y]
+                for x in range(
+                    clipRect.left // BLOCK_SIZE, (clipRect.right - 1) // BLOCK_SIZE + 1
+                ):
+                    collidedIdxs.append(row[x])
+        collidedIdxs.sort()
+        return collidedIdxs
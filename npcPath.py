@@ -0,0 +1,134 @@
+"""npcPath
+    * Holds the NpcPath class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+from array import array
+from bisect import bisect_right
+from gameConstants import *
+
+
+class NpcPath:
+    """NpcPath class
+    * Real path (top down view) an Enemy walks along, one position per path index
+    * Only stores the straight segments between corners, positions are calculated on access
+    * Can be used like the list of all positions (len, indexing, iterating, index)
+
+    Public Methods:
+    * def index(self, realPos)
+    """
+
+    def __init__(self, pixPath):
+        # Segment start index, real start position and step per index of every segment
+        self.segmentStarts = array("i")
+        self.xStarts = array("i")
+        self.yStarts = array("i")
+        self.xSteps = array("b")
+        self.ySteps = array("b")
+
+        for i in range(0, len(pixPath) - 1):
+            xStep = pixPath[i + 1][0] - pixPath[i][0]
+            yStep = pixPath[i + 1][1] - pixPath[i][1]
+            # Start new segment if direction changes
+            if (
+                len(self.segmentStarts) == 0
+                or xStep != self.xSteps[-1]
+                or yStep != self.ySteps[-1]
+            ):
+                self._add_segment(i * BLOCK_SIZE, pixPath[i], xStep, yStep)
+        # Path of one pixel only consists of a segment without movement
+        if len(self.segmentStarts) == 0:
+            self._add_segment(0, pixPath[0], 0, 0)
+
+        self.length = BLOCK_SIZE * (len(pixPath) - 1) + 1
+
+    def _add_segment(self, segmentStart, pixPos, xStep, yStep):
+        """add segment (private)
+        * Appends a segment starting at pixel pixPos to the segment arrays
+
+        Args:
+            segmentStart (int): Path index the segment starts at
+            pixPos (tuple): Pixel position the segment starts at
+            xStep (int): Real x movement per path index (-1, 0 or 1)
+            yStep (int): Real y movement per path index (-1, 0 or 1)
+
+        Return:
+            None
+
+        Test:
+            * All arrays grow by one element
+            * Start position is translated according to BLOCK_SIZE
+        """
+        self.segmentStarts.append(segmentStart)
+        self.xStarts.append(pixPos[0] * BLOCK_SIZE)
+        self.yStarts.append(pixPos[1] * BLOCK_SIZE)
+        self.xSteps.append(xStep)
+        self.ySteps.append(yStep)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, pathPos):
+        """get item
+        * Calculates the real position at a path index
+
+        Args:
+            pathPos (int): Path index, negative values count from the end
+
+        Raises:
+            IndexError: Path index out of range
+
+        Return:
+            (tuple): Real position at pathPos
+
+        Test:
+            * Positions match the ones of a path expanded pixel by pixel
+            * pathPos equal to the path length results in exception
+        """
+        if pathPos < 0:
+            pathPos += self.length
+        if not 0 <= pathPos < self.length:
+            raise IndexError("NpcPath index out of range")
+        i = bisect_right(self.segmentStarts, pathPos) - 1
+        n = pathPos - self.segmentStarts[i]
+        return (
+            self.xStarts[i] + n * self.xSteps[i],
+            self.yStarts[i] + n * self.ySteps[i],
+        )
+
+    def index(self, realPos):
+        """index
+        * Finds the first path index of a real position
+
+        Args:
+            realPos (tuple): Real position on the path
+
+        Raises:
+            ValueError: Position is not on the path
+
+        Return:
+            (int): First path index with this position
+
+        Test:
+            * Index of every corner position is found
+            * Position next to the path results in exception
+        """
+        segmentEnds = self.segmentStarts[1:] + array("i", [self.length - 1])
+        for i in range(0, len(self.segmentStarts)):
+            xDiff = realPos[0] - self.xStarts[i]
+            yDiff = realPos[1] - self.yStarts[i]
+            # Get number of steps needed on this segment
+            if self.xSteps[i] != 0:
+                n = xDiff * self.xSteps[i]
+            else:
+                n = yDiff * self.ySteps[i]
+            if (
+                0 <= n <= segmentEnds[i] - self.segmentStarts[i]
+                and xDiff == n * self.xSteps[i]
+                and yDiff == n * self.ySteps[i]
+            ):
+                return self.segmentStarts[i] + n
+        raise ValueError(str(realPos) + " is not in NpcPath")
@@ -0,0 +1,117 @@
+"""perfOverlay
+    * Holds the PerfOverlay class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import pygame
+from gameConstants import *
+
+
+class PerfOverlay:
+    """PerfOverlay class
+    * Panel over the game area showing FPS, the frame time of the clock, blits and the time per profiler section
+    * Rolling graph of the section times of the last frames, one stacked bar per frame
+    * The graph is scrolled by one bar per frame, only the newest bar is drawn
+
+    Public Methods:
+    * def draw(self, screen, clock, blitCount)
+    """
+
+    def __init__(self, profiler, font):
+        self.profiler = profiler
+        self.font = font
+        self.rect = pygame.Rect(PERF_OVERLAY_POS, PERF_OVERLAY_SIZE)
+        self.lineHeight = font.get_linesize()
+        textHeight = (len(profiler.sections) + 2) * self.lineHeight
+        self.graphRect = pygame.Rect(
+            X_PADDING // 2,
+            textHeight + X_PADDING,
+            PERF_GRAPH_BAR_WIDTH * PROFILER_HISTORY_SIZE,
+            self.rect.height - textHeight - 3 * X_PADDING // 2,
+        )
+        self.panel = pygame.Surface(self.rect.size)
+        self.panel.fill(BAR_COLOR)
+        self.graph = pygame.Surface(self.graphRect.size)
+        self.graph.fill(PERF_GRAPH_COLOR)
+
+    def _draw_graph(self):
+        """draw graph (private)
+        * Scrolls the graph left and adds a stacked bar of the last ended frame
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Sections of one frame are stacked in their colors, longest frame time fits PERF_GRAPH_MS
+            * Line at the frame budget of FRAMERATE is drawn
+        """
+        height = self.graphRect.height
+        x = self.graphRect.width - PERF_GRAPH_BAR_WIDTH
+        self.graph.scroll(-PERF_GRAPH_BAR_WIDTH, 0)
+        self.graph.fill(PERF_GRAPH_COLOR, (x, 0, PERF_GRAPH_BAR_WIDTH, height))
+        bottom = height
+        for i, section in enumerate(self.profiler.sections):
+            history = self.profiler.history[section]
+            if not history:
+                continue
+            barHeight = int(round(history[-1] * 1e3 / PERF_GRAPH_MS * height))
+            barHeight = min(barHeight, bottom)
+            bottom = bottom - barHeight
+            color = PERF_SECTION_COLORS[i % len(PERF_SECTION_COLORS)]
+            self.graph.fill(color, (x, bottom, PERF_GRAPH_BAR_WIDTH, barHeight))
+        # Frame budget
+        if FRAMERATE > 0:
+            budgetY = height - int(round(1000 / FRAMERATE / PERF_GRAPH_MS * height))
+            if budgetY >= 0:
+                self.graph.fill(TEXT_COLOR, (x, budgetY, PERF_GRAPH_BAR_WIDTH, 1))
+
+    def draw(self, screen, clock, blitCount):
+        """draw
+        * Draws the panel with the values of the last ended frame
+
+        Args:
+            screen (pygame.Surface): Surface of the whole window
+            clock (pygame.time.Clock): Clock of the game loop
+            blitCount (int): Number of blits onto the game Surface in the last frame
+
+        Return:
+            (pygame.Rect): Area covered on screen
+
+        Test:
+            * FPS and frame time match the clock, blits match Game.blitCount
+            * Every section of the profiler is listed in its graph color
+        """
+        self._draw_graph()
+        self.panel.fill(BAR_COLOR)
+        lines = [
+            (
+                "FPS %5.1f  frame %2d ms (busy %2d ms)"
+                % (clock.get_fps(), clock.get_time(), clock.get_rawtime()),
+                TEXT_COLOR,
+            ),
+            ("blits onto game %3d" % blitCount, TEXT_COLOR),
+        ]
+        for i, section in enumerate(self.profiler.sections):
+            history = self.profiler.history[section]
+            last = history[-1] * 1e3 if history else 0.0
+            lines.append(
+                (
+                    "%-10s %6.2f ms  p95 %6.2f ms"
+                    % (section, last, self.profiler.percentile(section, 95) * 1e3),
+                    PERF_SECTION_COLORS[i % len(PERF_SECTION_COLORS)],
+                )
+            )
+        for i, (text, color) in enumerate(lines):
+            # Changes every frame, not worth caching
+            textImg = self.font.render(text, False, color)
+            self.panel.blit(
+                textImg, (X_PADDING // 2, X_PADDING // 2 + i * self.lineHeight)
+            )
+        self.panel.blit(self.graph, self.graphRect)
+        return screen.blit(self.panel, self.rect)
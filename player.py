@@ -11,7 +11,7 @@ from loadsources import *
 from gameConstants import *
 
 
-class Player(pygame.sprite.Sprite):
+class Player(pygame.sprite.DirtySprite):
     """Player class
     * Loads all animations (idle, sprint, death)
     * Initiates frame and image counter for animation handling
@@ -20,31 +20,36 @@ class Player(pygame.sprite.Sprite):
     * Holds protect and death counter for special cases
 
     Public Methods:
+    * def reset(self)
     * def get_layer(self)
+    * def interpolate(self, alpha)
     * def deathProtect(self)
     * def die(self)
     * def move(self, keys)
-    * def update(self, realWallRects)
+    * def update(self, wallGrid)
     """
 
     def __init__(self, realStartPos):
-        pygame.sprite.Sprite.__init__(self)  # call Sprite initializer
-        self.idle_anim = load_animation("doctor_idle", scale=PLAYER_SIZE)
-        self.sprint_anim = load_animation("doctor_sprint", scale=PLAYER_SIZE)
-        self.death_anim = load_animation("doctor_death", scale=PLAYER_SIZE)
-        self.subFrameCounter = 0
-        self.imageCounter = 0
-        self.image = self.idle_anim[0]
-        self.realRect = pygame.Rect(realStartPos, (BLOCK_SIZE, BLOCK_SIZE))
+        pygame.sprite.DirtySprite.__init__(self)  # call DirtySprite initializer
+        # Load animations facing right and flipped ones facing left once
+        rightAnims = {}
+        leftAnims = {}
+        for name, folder in [
+            ("idle", "doctor_idle"),
+            ("sprint", "doctor_sprint"),
+            ("death", "doctor_death"),
+        ]:
+            rightAnims[name] = load_animation(folder, scale=PLAYER_SIZE)
+            leftAnims[name] = load_animation(folder, scale=PLAYER_SIZE, flipped=True)
+        self.anims = {"right": rightAnims, "left": leftAnims}
+        self.idle_anim = rightAnims["idle"]
+        self.sprint_anim = rightAnims["sprint"]
+        self.death_anim = rightAnims["death"]
+        self.realStartPos = realStartPos
         self.rect = self.idle_anim[0].get_rect()
-        self._calcRect()
-        self._layer = int(self.realRect.top / BLOCK_SIZE)
         self.realArea = pygame.Rect((0, 0), REAL_GAME_SIZE)
-        self.movex = 0
-        self.movey = 0
         self.facingRight = True
-        self.deathProtectCounter = 0
-        self.dyingCounter = 0
+        self.reset()
 
     def _get_middle_value(self, valueList):
         """get middle value (private)
@@ -65,13 +70,13 @@ class Player(pygame.sprite.Sprite):
         valueList.remove(min(valueList))
         return valueList[0]
 
-    def _turn(self):
+    def _turn(self, facingRight):
         """turn (private)
-        * horizontally flips all images if player changes orientation
+        * switches all animations to the ones facing the new orientation (no images are created)
         * gets skipped if player is dying (no more updates)
 
         Args:
-            None
+            facingRight (bool): New orientation of the player
 
         Return:
             None
@@ -83,21 +88,17 @@ class Player(pygame.sprite.Sprite):
 
         if self.dyingCounter:
             return
-        for i in range(0, len(self.idle_anim)):
-            self.idle_anim[i] = pygame.transform.flip(self.idle_anim[i], True, False)
-        for i in range(0, len(self.sprint_anim)):
-            self.sprint_anim[i] = pygame.transform.flip(
-                self.sprint_anim[i], True, False
-            )
-        for i in range(0, len(self.death_anim)):
-            self.death_anim[i] = pygame.transform.flip(self.death_anim[i], True, False)
-
-    def _calcRect(self):
+        side = "right" if facingRight else "left"
+        self.idle_anim = self.anims[side]["idle"]
+        self.sprint_anim = self.anims[side]["sprint"]
+        self.death_anim = self.anims[side]["death"]
+
+    def _calcRect(self, realPos):
         """calc rect (private)
         * Calculates the display rect sizes (gamer view) from real rect sizes (top down view)
 
         Args:
-            None
+            realPos (tuple): Real position (top down view) to translate
 
         Return:
             None
@@ -106,16 +107,34 @@ class Player(pygame.sprite.Sprite):
             * Correct translation with different BLOCK_SIZE values
             * No going out of bonds (batch testing)
         """
-        self.rect.x = self.realRect.x - int(round(0.5 * BLOCK_SIZE))
-        self.rect.y = int(round(0.7 * self.realRect.y)) + WALL_HEIGHT - self.rect.height
+        self.rect.x = realPos[0] - int(round(0.5 * BLOCK_SIZE))
+        self.rect.y = int(round(0.7 * realPos[1])) + WALL_HEIGHT - self.rect.height
+
+    def _updateDirty(self, previousImage, previousPos):
+        """update dirty (private)
+        * Marks the player to be drawn again if image or position changed during update
 
-    def _handleWallCollisions(self, realWallRects):
+        Args:
+            previousImage (pygame.Surface): Image before update
+            previousPos (tuple): Display position before update
+
+        Return:
+            None
+
+        Test:
+            * Standing player is only drawn again on a new animation image
+            * Moving player is drawn again every frame
+        """
+        if self.image is not previousImage or self.rect.topleft != previousPos:
+            self.dirty = 1
+
+    def _handleWallCollisions(self, wallGrid):
         """handle wall collisions (private)
         * Handles all possible collisions with stationary game objects
         * Pushes the player out of said objects if needed
 
         Args:
-            realWallRects (Rect): List of all real rects (top down view) of stationary game objects (walls)
+            wallGrid (WallGrid): Grid of all real rects (top down view) of stationary game objects (walls)
 
         Return:
             None
@@ -125,11 +144,11 @@ class Player(pygame.sprite.Sprite):
             * Fast changing user inputs have no effect on functionality
         """
 
-        collidedWallIdxs = self.realRect.collidelistall(realWallRects)
+        collidedWallIdxs = wallGrid.collidelistall(self.realRect)
 
         # Only colliding with horizontal or vertical wall
         if 0 < len(collidedWallIdxs) < 3:
-            collideRect = realWallRects[collidedWallIdxs[0]]
+            collideRect = wallGrid[collidedWallIdxs[0]]
             testRect = self.realRect.copy()
 
             # Assume collision with vertical wall
@@ -141,7 +160,7 @@ class Player(pygame.sprite.Sprite):
                 testRect.left = collideRect.right
 
             # Test assumption
-            testCollide = testRect.collidelist(realWallRects)
+            testCollide = wallGrid.collidelist(testRect)
             testDist = self.realRect.x - testRect.x
             if testCollide == -1 and -PLAYER_SPEED <= testDist <= PLAYER_SPEED:
                 # Assumption was correct and jump distance is in range, use it
@@ -159,24 +178,54 @@ class Player(pygame.sprite.Sprite):
             if self.movex > 0 and self.movey > 0:
                 # Moving right down
                 cornerIdx = max(collidedWallIdxs)
-                cornerRect = realWallRects[cornerIdx]
+                cornerRect = wallGrid[cornerIdx]
                 self.realRect.bottomright = cornerRect.topleft
             elif self.movex > 0 and self.movey < 0:
                 # Moving right up
                 cornerIdx = self._get_middle_value(collidedWallIdxs)
-                cornerRect = realWallRects[cornerIdx]
+                cornerRect = wallGrid[cornerIdx]
                 self.realRect.topright = cornerRect.bottomleft
             elif self.movex < 0 and self.movey > 0:
                 # Moving left down
                 cornerIdx = self._get_middle_value(collidedWallIdxs)
-                cornerRect = realWallRects[cornerIdx]
+                cornerRect = wallGrid[cornerIdx]
                 self.realRect.bottomleft = cornerRect.topright
             elif self.movex < 0 and self.movey < 0:
                 # Moving left up
                 cornerIdx = min(collidedWallIdxs)
-                cornerRect = realWallRects[cornerIdx]
+                cornerRect = wallGrid[cornerIdx]
                 self.realRect.topleft = cornerRect.bottomright
 
+    def reset(self):
+        """reset
+        * Puts the player back to the start position in initial state (facing right, not moving)
+        * Keeps all loaded animations
+
+        Args:
+            None
+
+        Return:
+            None
+
+        Test:
+            * Player is at start position after reset
+            * Player died facing left, after reset images are facing right again
+        """
+        self.dyingCounter = 0
+        self._turn(True)
+        self.facingRight = True
+        self.subFrameCounter = 0
+        self.imageCounter = 0
+        self.image = self.idle_anim[0]
+        self.realRect = pygame.Rect(self.realStartPos, (BLOCK_SIZE, BLOCK_SIZE))
+        self.previousRealPos = self.realRect.topleft
+        self._calcRect(self.realRect.topleft)
+        self._layer = int(self.realRect.top / BLOCK_SIZE)
+        self.dirty = 1
+        self.movex = 0
+        self.movey = 0
+        self.deathProtectCounter = 0
+
     def get_layer(self):
         """get layer
         * Getter function for layer attribute for correct blitting in 2.5D space
@@ -193,6 +242,32 @@ class Player(pygame.sprite.Sprite):
         """
         return self._layer
 
+    def interpolate(self, alpha):
+        """interpolate
+        * Places the display rect between the real positions of the last two updates
+        * Marks the player to be drawn again if the display position changed
+
+        Args:
+            alpha (float): Fraction of the way from the previous to the current real position (0 to 1)
+
+        Return:
+            None
+
+        Test:
+            * alpha 1 places the display rect like the last update did
+            * alpha 0 places the display rect at the position before the last update
+        """
+        previousPos = self.rect.topleft
+        realX = self.previousRealPos[0] + alpha * (
+            self.realRect.x - self.previousRealPos[0]
+        )
+        realY = self.previousRealPos[1] + alpha * (
+            self.realRect.y - self.previousRealPos[1]
+        )
+        self._calcRect((int(round(realX)), int(round(realY))))
+        if self.rect.topleft != previousPos:
+            self.dirty = 1
+
     def deathProtect(self):
         """death protect
         * Protects the player from dying for PROTECT_DURATION seconds
@@ -209,7 +284,7 @@ class Player(pygame.sprite.Sprite):
             * Player gets protected when colliding with Enemy while having at least one mask
         """
         # Activate death protect for specified duration
-        self.deathProtectCounter = int(round(PROTECT_DURATION * FRAMERATE))
+        self.deathProtectCounter = int(round(PROTECT_DURATION * TICK_RATE))
 
     def die(self):
         """die
@@ -227,7 +302,7 @@ class Player(pygame.sprite.Sprite):
             * Player can't move while dying
         """
         # Play dying animation
-        self.dyingCounter = int(round(DYING_DURATION * FRAMERATE))
+        self.dyingCounter = int(round(DYING_DURATION * TICK_RATE))
         self.subFrameCounter = 0
         self.imageCounter = 0
 
@@ -257,7 +332,7 @@ class Player(pygame.sprite.Sprite):
             elif key in [pygame.K_a, pygame.K_LEFT] and not movedX:
                 # Flip if direction changes
                 if self.facingRight:
-                    self._turn()
+                    self._turn(False)
                     self.facingRight = False
                 self.movex = -PLAYER_SPEED
                 movedX = True
@@ -267,7 +342,7 @@ class Player(pygame.sprite.Sprite):
             elif not movedX:
                 # Flip if direction changes
                 if not self.facingRight:
-                    self._turn()
+                    self._turn(True)
                     self.facingRight = True
                 self.movex = PLAYER_SPEED
                 movedX = True
@@ -280,7 +355,7 @@ class Player(pygame.sprite.Sprite):
         if not movedY:
             self.movey = 0
 
-    def update(self, realWallRects):
+    def update(self, wallGrid):
         """update
         * Sprite update function
         * Progresses animation
@@ -292,7 +367,7 @@ class Player(pygame.sprite.Sprite):
         * Handles protected and dying events
 
         Args:
-            realWallRects (Rect): List of real rectangles of walls (top down view sizes)
+            wallGrid (WallGrid): Grid of real rectangles of walls (top down view sizes)
 
         Return:
             None
@@ -302,7 +377,10 @@ class Player(pygame.sprite.Sprite):
             * Collide with wall
         """
 
-        logging.debug("Updating player animation...")
+        previousImage = self.image
+        previousPos = self.rect.topleft
+        self.previousRealPos = self.realRect.topleft
+
         # Animate Character
         if self.subFrameCounter == ANIMATION_REFRESH - 1:
             # Increment ImageCounter
@@ -331,6 +409,7 @@ class Player(pygame.sprite.Sprite):
         if self.dyingCounter:
             # If yes, decrement counter and skip movement etc.
             self.dyingCounter = self.dyingCounter - 1
+            self._updateDirty(previousImage, previousPos)
             return
 
         # Move Character
@@ -352,10 +431,10 @@ class Player(pygame.sprite.Sprite):
                 self.realRect.bottom = self.realArea.bottom
 
         # Handle wall collisions
-        self._handleWallCollisions(realWallRects)
+        self._handleWallCollisions(wallGrid)
 
         # Translate real rect to display rect
-        self._calcRect()
+        self._calcRect(self.realRect.topleft)
 
         # Update layer
         self._layer = int(self.realRect.top / BLOCK_SIZE)
@@ -368,4 +447,4 @@ class Player(pygame.sprite.Sprite):
         if (self.deathProtectCounter % 8) in range(5, 8):
             self.image = pygame.Surface((0, 0))
 
-    logging.debug("Updating player animation was successful")
+        self._updateDirty(previousImage, previousPos)
@@ -0,0 +1,120 @@
+"""spatialHash
+    * Holds the SpatialHash class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+from gameConstants import *
+
+
+class SpatialHash:
+    """SpatialHash class
+    * Sorts sprites by their real rects (top down view) into buckets of a uniform grid
+    * Collision queries only test the sprites in the buckets below the queried rect
+    * Holds sprites that don't move (e.g. masks), a moved sprite has to be added again
+
+    Public Methods:
+    * def add(self, sprite)
+    * def remove(self, sprite)
+    * def collide(self, rect)
+    """
+
+    def __init__(self, cellSize=SPATIAL_HASH_CELL_SIZE):
+        self.cellSize = cellSize
+        # Sprites of every cell, dicts keep the order sprites were added in
+        self.buckets = {}
+        # Cells every sprite is currently sorted into
+        self.spriteCells = {}
+
+    def __len__(self):
+        return len(self.spriteCells)
+
+    def _get_cells(self, rect):
+        """get cells (private)
+        * Determines all grid cells a rect overlaps
+
+        Args:
+            rect (pygame.Rect): Real rect (top down view)
+
+        Return:
+            cells (tuple): (x, y) keys of all overlapped cells
+
+        Test:
+            * Rect inside one cell returns one cell
+            * Rect on the corner of four cells returns four cells
+        """
+        left = rect.left // self.cellSize
+        right = (rect.right - 1) // self.cellSize
+        top = rect.top // self.cellSize
+        bottom = (rect.bottom - 1) // self.cellSize
+        return tuple(
+            (x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)
+        )
+
+    def add(self, sprite):
+        """add
+        * Sorts a sprite into the buckets of all cells its real rect overlaps
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite with realRect attribute
+
+        Return:
+            None
+
+        Test:
+            * Sprite is returned by collide with its own real rect
+            * Adding a sprite twice does not result in duplicates
+            * Sprite added again after moving is only found at its new position
+        """
+        self.remove(sprite)
+        cells = self._get_cells(sprite.realRect)
+        self.spriteCells[sprite] = cells
+        for cell in cells:
+            self.buckets.setdefault(cell, {})[sprite] = None
+
+    def remove(self, sprite):
+        """remove
+        * Removes a sprite from all buckets
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite with realRect attribute
+
+        Return:
+            None
+
+        Test:
+            * Removed sprite is not returned by collide anymore
+            * Removing a sprite that was never added does not result in exception
+        """
+        cells = self.spriteCells.pop(sprite, ())
+        for cell in cells:
+            bucket = self.buckets[cell]
+            del bucket[sprite]
+            if len(bucket) == 0:
+                del self.buckets[cell]
+
+    def collide(self, rect):
+        """collide
+        * Finds all sprites whose real rects collide with rect
+
+        Args:
+            rect (pygame.Rect): Real rect (top down view) to test
+
+        Return:
+            collidedSprites (list): All colliding sprites, each once
+
+        Test:
+            * Result equals pygame.sprite.spritecollide with real rects for rects all over the map
+            * Rect far from all sprites returns empty list
+        """
+        collidedSprites = []
+        for cell in self._get_cells(rect):
+            bucket = self.buckets.get(cell)
+            if bucket is None:
+                continue
+            for sprite in bucket:
+                if sprite.realRect.colliderect(rect) and sprite not in collidedSprites:
+                    collidedSprites.append(sprite)
+        return collidedSprites
@@ -0,0 +1,111 @@
+"""textCache
+    * Holds the TextCache class and the textCache used by the whole game
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+import logging
+from collections import OrderedDict
+import pygame
+from gameConstants import *
+
+
+class TextCache:
+    """TextCache class
+    * Resolves every system font once and keeps it
+    * Keeps the most recently rendered texts, so unchanged labels are not rendered again
+    * Counts cache hits and misses for instrumentation
+
+    Public Methods:
+    * def get_font(self, name, size)
+    * def render(self, font, text, color, outlineColor=None)
+    * def stats(self)
+    """
+
+    def __init__(self, maxEntries=TEXT_CACHE_SIZE):
+        self.fonts = {}
+        # Rendered surfaces by (font, text, color, outlineColor), least recently used first
+        self.texts = OrderedDict()
+        self.maxEntries = maxEntries
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, name, size):
+        """get font
+        * Returns a system font, looks it up only on first use
+
+        Args:
+            name (string): Name of the system font
+            size (int): Font size
+
+        Return:
+            font (pygame.font.Font): Cached font
+
+        Test:
+            * Same Font object is returned on every call
+            * Unknown font name returns pygame default font
+        """
+        key = (name, size)
+        if key not in self.fonts:
+            logging.info("Loading font " + str(name) + " " + str(size) + "...")
+            self.fonts[key] = pygame.font.SysFont(name, size)
+        return self.fonts[key]
+
+    def render(self, font, text, color, outlineColor=None):
+        """render
+        * Returns the rendered text, renders it only if it is not cached
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (string): Text to render
+            color (tuple): Text color as rgb value
+            outlineColor (tuple, optional): Color of a 1 pixel frame around the text. Defaults to None.
+
+        Return:
+            textImg (pygame.Surface): Rendered text, must not be changed by the caller
+
+        Test:
+            * Second call with same arguments returns the same Surface and increases hits
+            * More than maxEntries different texts evict the least recently used one
+        """
+        key = (font, text, color, outlineColor)
+        if key in self.texts:
+            self.hits = self.hits + 1
+            self.texts.move_to_end(key)
+            return self.texts[key]
+
+        self.misses = self.misses + 1
+        textImg = font.render(text, False, color)
+        if outlineColor is not None:
+            pygame.draw.rect(textImg, outlineColor, textImg.get_rect(), 1)
+        self.texts[key] = textImg
+        if len(self.texts) > self.maxEntries:
+            self.texts.popitem(last=False)
+        return textImg
+
+    def stats(self):
+        """stats
+        * Returns cache statistics
+
+        Args:
+            None
+
+        Return:
+            (dict): Number of hits, misses, cached fonts and cached texts
+
+        Test:
+            * Values match the number of render calls
+            * Texts never exceed maxEntries
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fonts": len(self.fonts),
+            "texts": len(self.texts),
+        }
+
+
+# Text cache of the whole game
+textCache = TextCache()
@@ -0,0 +1,86 @@
+"""wallGrid
+    * Holds the WallGrid class
+
+    Attributes:
+        authors: Benjamin Ader & Sujan Kanapathipillai
+        date: 06.06.2021
+        version: 0.0.1
+"""
+from gameConstants import *
+
+
+class WallGrid:
+    """WallGrid class
+    * Tile occupancy grid of all walls of a level for fast collision detection
+    * Collision queries only look at the (at most 4 for a player) tiles below the queried rect
+    * Can be used like the list of real wall rects it was created from (indexing, len, iterating)
+
+    Public Methods:
+    * def collidelistall(self, rect)
+    * def collidelist(self, rect)
+    """
+
+    def __init__(self, realWallRects):
+        self.realWallRects = realWallRects
+        self.columns = int(REAL_GAME_SIZE[0] / BLOCK_SIZE)
+        self.rows = int(REAL_GAME_SIZE[1] / BLOCK_SIZE)
+        # Index of the wall rect on every tile, -1 if there is no wall
+        self.tiles = [[-1] * self.columns for _ in range(0, self.rows)]
+        for i, rect in enumerate(realWallRects):
+            self.tiles[rect.y // BLOCK_SIZE][rect.x // BLOCK_SIZE] = i
+
+    def __len__(self):
+        return len(self.realWallRects)
+
+    def __getitem__(self, idx):
+        return self.realWallRects[idx]
+
+    def collidelistall(self, rect):
+        """collidelistall
+        * Same result as rect.collidelistall(realWallRects), only checks tiles below rect
+
+        Args:
+            rect (pygame.Rect): Real rect (top down view) to test
+
+        Return:
+            collidedIdxs (list): Ascending indices of all colliding wall rects
+
+        Test:
+            * Result equals pygame.Rect.collidelistall for rects all over the map
+            * Rects partly out of the map do not result in exception
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        # Get range of tiles below rect
+        left = max(rect.left // BLOCK_SIZE, 0)
+        right = min((rect.right - 1) // BLOCK_SIZE, self.columns - 1)
+        top = max(rect.top // BLOCK_SIZE, 0)
+        bottom = min((rect.bottom - 1) // BLOCK_SIZE, self.rows - 1)
+
+        collidedIdxs = []
+        for y in range(top, bottom + 1):
+            row = self.tiles[y]
+            for x in range(left, right + 1):
+                if row[x] >= 0:
+                    collidedIdxs.append(row[x])
+        collidedIdxs.sort()
+        return collidedIdxs
+
+    def collidelist(self, rect):
+        """collidelist
+        * Same result as rect.collidelist(realWallRects), only checks tiles below rect
+
+        Args:
+            rect (pygame.Rect): Real rect (top down view) to test
+
+        Return:
+            (int): Lowest index of a colliding wall rect, -1 if there is no collision
+
+        Test:
+            * Result equals pygame.Rect.collidelist for rects all over the map
+            * Rect without collision returns -1
+        """
+        collidedIdxs = self.collidelistall(rect)
+        if len(collidedIdxs) == 0:
+            return -1
+        return collidedIdxs[0]